@@ -0,0 +1,166 @@
+"""Benchmark the integration against the fake Whirlpool cloud.
+
+For each oven count, a fresh Home Assistant sets up a config entry against a fake
+account, then receives door open and close pushes for random ovens. The results are
+written as JSON:
+
+    python benchmarks/run_benchmarks.py --ovens 1 10 100 --output results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+
+# The fake backend and test helpers live in the tests package of the repository
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.common import (  # noqa: E402
+    DOMAIN,
+    async_add_entry,
+    async_test_home_assistant,
+    async_wait_connected,
+)
+from tests.fake_backend import FakeWhirlpoolBackend  # noqa: E402
+
+DOOR_ATTRIBUTE = "OvenUpperCavity_OpStatusDoorOpen"
+
+
+def percentile(values: list[float], percent: float) -> float | None:
+    """Return a percentile of the values, by the nearest rank."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def async_benchmark(
+    ovens: int, events: int, update_window: int, latency: float
+) -> dict[str, Any]:
+    """Set up an entry with a number of ovens and measure its push handling."""
+    backend = FakeWhirlpoolBackend.with_ovens(ovens)
+    backend.latency = latency
+    await backend.start()
+    try:
+        with backend.patch_urls(), tempfile.TemporaryDirectory() as config_dir:
+            async with async_test_home_assistant(Path(config_dir)) as hass:
+                start = time.monotonic()
+                entry = await async_add_entry(hass, {"update_window": update_window})
+                setup_time = time.monotonic() - start
+                await async_wait_connected(hass, entry, backend)
+                connected_time = time.monotonic() - start
+
+                writes: list[tuple[float, str]] = []
+
+                @callback
+                def async_state_changed(event: Event) -> None:
+                    """Record when each entity state was written."""
+                    writes.append((time.monotonic(), event.data["entity_id"]))
+
+                hass.bus.async_listen(EVENT_STATE_CHANGED, async_state_changed)
+                devices = hass.data[DOMAIN][entry.entry_id]["oven"]
+                saids = list(devices)
+                door = dict.fromkeys(saids, False)
+                latencies: list[float] = []
+                writes_per_event: list[int] = []
+                for _ in range(events):
+                    said = random.choice(saids)
+                    door[said] = not door[said]
+                    entity_id = f"binary_sensor.oven_{said.lower()}_oven_door"
+                    writes.clear()
+                    pushed_at = time.monotonic()
+                    await backend.push(said, {DOOR_ATTRIBUTE: str(int(door[said]))})
+                    # Wait for the update window to pass and the entities to settle
+                    await asyncio.sleep(update_window / 1000 + 0.1)
+                    await hass.async_block_till_done()
+                    written = [
+                        at for at, written_id in writes if written_id == entity_id
+                    ]
+                    if written:
+                        latencies.append(written[0] - pushed_at)
+                    writes_per_event.append(len(writes))
+
+                await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+    finally:
+        await backend.stop()
+
+    return {
+        "ovens": ovens,
+        "events": events,
+        "update_window_ms": update_window,
+        "backend_latency_s": latency,
+        "setup_time_s": setup_time,
+        "connected_time_s": connected_time,
+        "push_to_state_latency_s": {
+            "mean": statistics.fmean(latencies) if latencies else None,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "max": max(latencies, default=None),
+            "missed": events - len(latencies),
+        },
+        "state_writes_per_event": statistics.fmean(writes_per_event),
+        "requests": dict(backend.requests),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Run the benchmark for every oven count."""
+    results = []
+    for ovens in args.ovens:
+        result = await async_benchmark(
+            ovens, args.events, args.update_window, args.backend_latency
+        )
+        print(
+            f"{ovens} ovens: setup {result['setup_time_s']:.3f}s, connected "
+            f"{result['connected_time_s']:.3f}s, push to state "
+            f"{result['push_to_state_latency_s']['p50']}s (p50), "
+            f"{result['state_writes_per_event']:.2f} state writes per event",
+            file=sys.stderr,
+        )
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Parse the arguments and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ovens", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--update-window", type=int, default=50, help="milliseconds")
+    parser.add_argument(
+        "--backend-latency", type=float, default=0.0, help="seconds per request"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="JSON file, stdout by default")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    random.seed(args.seed)
+    results = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": asyncio.run(async_main(args)),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
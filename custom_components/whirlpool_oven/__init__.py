@@ -1,75 +1,480 @@
 """The Whirlpool Appliances integration."""
 
+from __future__ import annotations
+
 import asyncio
+from datetime import datetime
+from functools import partial
+import time
+from typing import TYPE_CHECKING
 
 from aiohttp import ClientError
-from whirlpool.appliancesmanager import AppliancesManager
-from whirlpool.auth import Auth
-from whirlpool.backendselector import BackendSelector
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
+
+from .account import WhirlpoolAccount
+from .const import (
+    CONF_ACCOUNT,
+    CONF_APPLIANCES,
+    CONF_INVENTORY_LOCK,
+    CONF_MISSING,
+    CONF_OVEN,
+    CONF_PLATFORMS,
+    CONF_RECORD_TRAFFIC,
+    CONF_SCHEDULER,
+    CONF_SESSIONS,
+    CONF_TRAFFIC_RECORDER,
+    CONF_UPDATE_WINDOW,
+    CONNECT_TIMEOUT,
+    DEFAULT_UPDATE_WINDOW,
+    DISCOVERY_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    RETIRE_AFTER_MISSES,
+    SIGNAL_DEVICE_ADDED,
+)
+from .scheduler import KeepAliveScheduler
+from .services import async_setup_services
+from .sessions import CookSessionTracker
+from .storage import (
+    async_load_inventory,
+    async_remove_auth,
+    async_remove_inventory,
+    async_remove_sessions,
+    async_save_auth,
+    async_save_inventory,
+)
+from .supervisor import backoff_delay
+from .traffic import TrafficRecorder, remove_traffic_log, traffic_log_path
+from .websocket_api import async_setup_websocket_api
 
-from .const import CONF_BRAND, CONF_BRANDS_MAP, CONF_OVEN, CONF_REGION_MAP, DOMAIN
-from .device import WhirlpoolOvenDevice, WhirpoolApplianceData
+if TYPE_CHECKING:
+    from .device import WhirlpoolOvenDevice
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.LIGHT, Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Whirlpool Appliances services and websocket API."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up Whirlpool Appliances from a config entry."""
 
-    session = async_get_clientsession(hass)
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][config_entry.entry_id] = {}
 
-    region = CONF_REGION_MAP[config_entry.data.get(CONF_REGION, "EU")]
-    brand = CONF_BRANDS_MAP[config_entry.data.get(CONF_BRAND, "Whirlpool")]
-    backend_selector = BackendSelector(brand, region)
-    auth = Auth(
-        backend_selector,
-        config_entry.data[CONF_USERNAME],
-        config_entry.data[CONF_PASSWORD],
-        session,
-    )
-
+    account = WhirlpoolAccount(hass, config_entry.data)
+    inventory = await async_load_inventory(hass, config_entry.entry_id)
     try:
-        await auth.do_auth(store=False)
+        await account.async_authenticate(config_entry.entry_id)
     except (ClientError, TimeoutError) as err:
-        raise ConfigEntryNotReady("Unable to connect to Whirlpool") from err
+        if inventory is None:
+            raise ConfigEntryNotReady("Unable to connect to Whirlpool") from err
+        # Start from the saved inventory, with unavailable entities until the cloud
+        # can be reached again
+        LOGGER.warning("Unable to connect to Whirlpool, retrying in the background")
+        authenticated = False
+    else:
+        if not account.auth.is_access_token_valid():
+            raise ConfigEntryAuthFailed("Incorrect password")
+        authenticated = True
+
+    hass.data[DOMAIN][config_entry.entry_id][CONF_ACCOUNT] = account
 
-    if not auth.is_access_token_valid():
-        raise ConfigEntryAuthFailed("Incorrect password")
+    # Create the ovens from the saved inventory when there is one, so entities do
+    # not wait for the cloud; the inventory is reconciled in the background
+    if inventory is None:
+        try:
+            appliances_manager = await account.async_fetch_appliances()
+        except (ClientError, TimeoutError) as err:
+            # Also raised while the cloud call circuit breaker is open
+            raise ConfigEntryNotReady(
+                "Unable to fetch appliances from Whirlpool"
+            ) from err
+        if appliances_manager is None:
+            raise ConfigEntryNotReady("Unable to fetch appliances from Whirlpool")
+        inventory = [{"appliance": oven} for oven in appliances_manager.ovens]
+        cached = False
+    else:
+        cached = True
 
-    appliances_manager = AppliancesManager(backend_selector, auth, session)
-    if not await appliances_manager.fetch_appliances():
-        raise ConfigEntryNotReady("Unable to fetch appliances from Whirlpool")
+    if config_entry.options.get(CONF_RECORD_TRAFFIC):
+        hass.data[DOMAIN][config_entry.entry_id][
+            CONF_TRAFFIC_RECORDER
+        ] = await hass.async_add_executor_job(
+            TrafficRecorder,
+            traffic_log_path(hass, config_entry.entry_id),
+        )
 
     hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN] = {}
-    for oven in appliances_manager.ovens:
-        appliance_data = WhirpoolApplianceData(oven)
-        device = WhirlpoolOvenDevice(
-            hass, appliance_data, backend_selector, auth, session
+    # The startup reconcile and the discovery must not change the ovens at once
+    hass.data[DOMAIN][config_entry.entry_id][CONF_INVENTORY_LOCK] = asyncio.Lock()
+    hass.data[DOMAIN][config_entry.entry_id][CONF_MISSING] = {}
+    devices: list[WhirlpoolOvenDevice] = []
+    for oven in inventory:
+        device = create_device(
+            hass, config_entry, account, oven["appliance"], oven.get("cavities")
         )
-        await device.connect()
+        devices.append(device)
         hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN][
             device.appliance_data.said
         ] = device
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    scheduler = KeepAliveScheduler(
+        hass, hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN]
+    )
+    scheduler.async_start()
+    config_entry.async_on_unload(scheduler.async_stop)
+    hass.data[DOMAIN][config_entry.entry_id][CONF_SCHEDULER] = scheduler
+
+    sessions = CookSessionTracker(hass, config_entry.entry_id)
+    await sessions.async_start(devices)
+    config_entry.async_on_unload(sessions.async_stop)
+    hass.data[DOMAIN][config_entry.entry_id][CONF_SESSIONS] = sessions
+
+    connect_tasks = (
+        async_start_connections(hass, config_entry, devices) if authenticated else []
+    )
+    if not cached:
+        await async_wait_connections(connect_tasks)
+
+    # Only set up the platforms the ovens create entities on
+    platforms = entry_platforms(devices, inventory)
+    hass.data[DOMAIN][config_entry.entry_id][CONF_PLATFORMS] = platforms
+
+    config_entry.async_create_background_task(
+        hass,
+        async_reconcile_inventory(hass, config_entry, connect_tasks, cached)
+        if authenticated
+        else async_authenticate_in_background(hass, config_entry, devices),
+        f"{DOMAIN}-inventory-{config_entry.entry_id}",
+    )
+
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
+    config_entry.async_on_unload(config_entry.add_update_listener(async_update_options))
+    config_entry.async_on_unload(
+        async_track_time_interval(
+            hass, partial(async_discover_ovens, hass, config_entry), DISCOVERY_INTERVAL
+        )
+    )
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(config_entry.entry_id)
+
+
+def create_device(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    account: WhirlpoolAccount,
+    appliance: dict[str, str],
+    cavities: list[int] | None = None,
+) -> WhirlpoolOvenDevice:
+    """Create the device of an oven in the account."""
+    # The device module loads the oven support of the library, which the config flow
+    # and an integration without entries do not need
+    from whirlpool.oven import Cavity
+
+    from .device import WhirlpoolOvenDevice, WhirpoolApplianceData
+
+    device = WhirlpoolOvenDevice(
+        hass,
+        WhirpoolApplianceData(appliance),
+        account.backend_selector,
+        account.auth,
+        account.session,
+        None if cavities is None else [Cavity(cavity) for cavity in cavities],
+        config_entry.options.get(CONF_UPDATE_WINDOW, DEFAULT_UPDATE_WINDOW) / 1000,
+    )
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    if (recorder := entry_data.get(CONF_TRAFFIC_RECORDER)) is not None:
+        recorder.attach(device)
+    return device
+
+
+def async_start_connections(
+    hass: HomeAssistant, config_entry: ConfigEntry, devices: list[WhirlpoolOvenDevice]
+) -> list[asyncio.Task]:
+    """Connect all ovens concurrently, so a slow push stream does not hold up others."""
+    return [
+        config_entry.async_create_background_task(
+            hass, device.connect(), f"{DOMAIN}-connect-{device.appliance_data.said}"
+        )
+        for device in devices
+    ]
+
+
+async def async_wait_connections(connect_tasks: list[asyncio.Task]) -> None:
+    """Wait for ovens to connect, up to a deadline, logging the ones that failed."""
+    if not connect_tasks:
+        return
+    # Ovens still waiting for the rate limiter finish connecting in the background
+    start = time.monotonic()
+    done, pending = await asyncio.wait(connect_tasks, timeout=CONNECT_TIMEOUT)
+    LOGGER.debug(
+        f"Connected {len(connect_tasks) - len(pending)} of {len(connect_tasks)} "
+        f"ovens in {time.monotonic() - start:.3f}s"
+    )
+    for task in done:
+        if not task.cancelled() and (err := task.exception()) is not None:
+            LOGGER.error(f"Unable to connect {task.get_name()}: {err!r}")
+    if pending:
+        LOGGER.warning(
+            f"{len(pending)} ovens did not connect within {CONNECT_TIMEOUT}s, "
+            "continuing in the background"
+        )
+
+
+async def async_authenticate_in_background(
+    hass: HomeAssistant, config_entry: ConfigEntry, devices: list[WhirlpoolOvenDevice]
+) -> None:
+    """Retry authentication with backoff, then connect the ovens."""
+    account: WhirlpoolAccount = hass.data[DOMAIN][config_entry.entry_id][CONF_ACCOUNT]
+    attempt = 0
+    while True:
+        await asyncio.sleep(backoff_delay(attempt))
+        try:
+            await account.async_authenticate(config_entry.entry_id)
+        except (ClientError, TimeoutError) as err:
+            LOGGER.debug(f"Authenticating with Whirlpool failed: {err}")
+            attempt += 1
+            continue
+        break
+
+    if not account.auth.is_access_token_valid():
+        config_entry.async_start_reauth(hass)
+        return
+
+    LOGGER.info("Connected to Whirlpool, connecting the ovens")
+    connect_tasks = async_start_connections(hass, config_entry, devices)
+    await async_reconcile_inventory(hass, config_entry, connect_tasks, True)
+
+
+@callback
+def async_discover_ovens(
+    hass: HomeAssistant, config_entry: ConfigEntry, _now: datetime
+) -> None:
+    """Check the account for added or removed ovens in the background."""
+    config_entry.async_create_background_task(
+        hass,
+        async_reconcile_inventory(hass, config_entry, [], True),
+        f"{DOMAIN}-discovery-{config_entry.entry_id}",
+    )
+
+
+async def async_reconcile_inventory(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    connect_tasks: list[asyncio.Task],
+    cached: bool,
+) -> None:
+    """Check the ovens against the cloud and save the inventory."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    async with entry_data[CONF_INVENTORY_LOCK]:
+        await _async_reconcile_inventory(hass, config_entry, connect_tasks, cached)
+
+
+async def _async_reconcile_inventory(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    connect_tasks: list[asyncio.Task],
+    cached: bool,
+) -> None:
+    """Check the ovens against the cloud and save the inventory, holding its lock."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    devices: dict[str, WhirlpoolOvenDevice] = entry_data[CONF_OVEN]
+    account: WhirlpoolAccount = entry_data[CONF_ACCOUNT]
+    inventory = await async_load_inventory(hass, config_entry.entry_id) or []
+
+    if cached:
+        try:
+            appliances_manager = await account.async_fetch_appliances()
+        except (ClientError, TimeoutError):
+            appliances_manager = None
+        if appliances_manager is None:
+            LOGGER.warning("Unable to refresh appliances from Whirlpool")
+            return
+        # A list reused from the cache was already compared, and must not count
+        # as another check of the missing ovens
+        if appliances_manager is not entry_data.get(CONF_APPLIANCES):
+            entry_data[CONF_APPLIANCES] = appliances_manager
+            connect_tasks = [
+                *connect_tasks,
+                *await async_update_ovens(
+                    hass,
+                    config_entry,
+                    appliances_manager.ovens,
+                    account.appliances_complete,
+                ),
+            ]
+
+    await async_wait_connections(connect_tasks)
+    # Ovens are added and removed in place, but a change to the cavities of an oven
+    # or a platform that was not set up needs a reload
+    changed = any(
+        device.connected and device.detect_cavities() != device.cavities
+        for device in devices.values()
+    )
+    changed |= not set(entry_platforms(list(devices.values()), inventory)) <= set(
+        entry_data[CONF_PLATFORMS]
+    )
+
+    # Ovens missing from the account but not retired yet stay in the inventory
+    await async_save_inventory(
+        hass,
+        config_entry.entry_id,
+        [
+            {
+                "appliance": device.appliance_data.as_dict(),
+                "cavities": saved_cavities(device),
+                "platforms": saved_platforms(device),
+            }
+            for device in devices.values()
+        ],
+    )
+
+    if changed:
+        LOGGER.info("The ovens in the Whirlpool account have changed, reloading")
+        hass.async_create_task(hass.config_entries.async_reload(config_entry.entry_id))
+
+
+async def async_update_ovens(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    appliances: list[dict[str, str]],
+    complete: bool,
+) -> list[asyncio.Task]:
+    """Retire the ovens removed from the account and connect the added ones."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    devices: dict[str, WhirlpoolOvenDevice] = entry_data[CONF_OVEN]
+    missing: dict[str, int] = entry_data[CONF_MISSING]
+    saids = {appliance["SAID"] for appliance in appliances}
+    for said in saids:
+        missing.pop(said, None)
+    for said in set(devices) - saids:
+        # A failed owned or shared list leaves out ovens that are still there
+        if not complete:
+            LOGGER.debug(f"Oven {said} is missing from an incomplete appliance list")
+            continue
+        missing[said] = missing.get(said, 0) + 1
+        if missing[said] < RETIRE_AFTER_MISSES:
+            LOGGER.debug(
+                f"Oven {said} is missing from the Whirlpool account "
+                f"({missing[said]} of {RETIRE_AFTER_MISSES} checks)"
+            )
+            continue
+        del missing[said]
+        await async_retire_oven(hass, config_entry, devices[said])
+
+    added: list[WhirlpoolOvenDevice] = []
+    for appliance in appliances:
+        if appliance["SAID"] in devices:
+            continue
+        LOGGER.info(f"Oven {appliance['SAID']} was added to the Whirlpool account")
+        device = create_device(hass, config_entry, entry_data[CONF_ACCOUNT], appliance)
+        devices[appliance["SAID"]] = device
+        entry_data[CONF_SESSIONS].async_add_device(device)
+        async_dispatcher_send(
+            hass, SIGNAL_DEVICE_ADDED.format(config_entry.entry_id), device
+        )
+        added.append(device)
+    return async_start_connections(hass, config_entry, added)
+
+
+async def async_retire_oven(
+    hass: HomeAssistant, config_entry: ConfigEntry, device: WhirlpoolOvenDevice
+) -> None:
+    """Disconnect an oven removed from the account and remove its entities."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    said = device.appliance_data.said
+    if entry_data[CONF_OVEN].pop(said, None) is None:
+        return
+    LOGGER.info(f"Oven {said} was removed from the Whirlpool account")
+    entry_data[CONF_SCHEDULER].async_cancel(said)
+    entry_data[CONF_SESSIONS].async_remove_device(device)
+    await device.disconnect()
+
+    # Entities of the entry go with the device
+    device_registry = dr.async_get(hass)
+    if device_entry := device_registry.async_get_device(identifiers={(DOMAIN, said)}):
+        device_registry.async_update_device(
+            device_entry.id, remove_config_entry_id=config_entry.entry_id
+        )
+
+
+def saved_cavities(device: WhirlpoolOvenDevice | None) -> list[int] | None:
+    """Return the cavities of an oven to save in the inventory."""
+    if device is None:
+        return None
+    cavities = device.detect_cavities() if device.connected else device.cavities
+    return None if cavities is None else [cavity.value for cavity in cavities]
+
+
+def saved_platforms(device: WhirlpoolOvenDevice | None) -> list[str] | None:
+    """Return the platforms of an oven to save in the inventory."""
+    if device is None or not device.connected:
+        return None
+    return sorted(device.detect_platforms())
+
+
+def entry_platforms(
+    devices: list[WhirlpoolOvenDevice], inventory: list[dict]
+) -> list[Platform]:
+    """Return the platforms with entities for the ovens of a config entry."""
+    saved = {oven["appliance"]["SAID"]: oven.get("platforms") for oven in inventory}
+    platforms: set[Platform] = set()
+    for device in devices:
+        if device.connected:
+            platforms |= device.detect_platforms()
+        elif (device_platforms := saved.get(device.appliance_data.said)) is not None:
+            platforms.update(Platform(platform) for platform in device_platforms)
+        else:
+            # Not known until the oven connects
+            return PLATFORMS
+    return [platform for platform in PLATFORMS if platform in platforms]
+
+
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
+        config_entry, hass.data[DOMAIN][config_entry.entry_id][CONF_PLATFORMS]
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(config_entry.entry_id)
+        await asyncio.gather(
+            *(device.disconnect() for device in entry_data[CONF_OVEN].values())
+        )
+        if (recorder := entry_data.get(CONF_TRAFFIC_RECORDER)) is not None:
+            await hass.async_add_executor_job(recorder.stop)
+        # Tokens may have been renewed while running
+        await async_save_auth(
+            hass, config_entry.entry_id, entry_data[CONF_ACCOUNT].auth
+        )
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the saved data of a config entry."""
+    await async_remove_auth(hass, config_entry.entry_id)
+    await async_remove_inventory(hass, config_entry.entry_id)
+    await async_remove_sessions(hass, config_entry.entry_id)
+    await hass.async_add_executor_job(
+        remove_traffic_log, traffic_log_path(hass, config_entry.entry_id)
+    )
@@ -0,0 +1,99 @@
+"""The Whirlpool account session of a Whirlpool Appliances config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from whirlpool.appliancesmanager import AppliancesManager
+from whirlpool.auth import Auth
+from whirlpool.backendselector import BackendSelector
+
+from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import APPLIANCES_CACHE_TIME, CONF_BRAND, CONF_BRANDS_MAP, CONF_REGION_MAP
+from .ratelimit import CallPriority, async_get_rate_limiter
+from .storage import async_load_auth, async_save_auth
+
+
+class WhirlpoolAccount:
+    """An authenticated Whirlpool session, shared by the setup and the ovens of an entry."""
+
+    def __init__(self, hass: HomeAssistant, data: dict[str, str]) -> None:
+        """Initialize the account."""
+        self.hass = hass
+        self.session = async_get_clientsession(hass)
+        self.password = data[CONF_PASSWORD]
+        self.backend_selector = BackendSelector(
+            CONF_BRANDS_MAP[data.get(CONF_BRAND, "Whirlpool")],
+            CONF_REGION_MAP[data.get(CONF_REGION, "EU")],
+        )
+        self.auth = Auth(
+            self.backend_selector, data[CONF_USERNAME], self.password, self.session
+        )
+        self.limiter = async_get_rate_limiter(hass)
+        self._restored = False
+        self._auth_lock = asyncio.Lock()
+        self._fetch_lock = asyncio.Lock()
+        self._appliances: AppliancesManager | None = None
+        self._fetched_at = 0.0
+        # False when the last fetch missed the owned or the shared appliances
+        self.appliances_complete = False
+
+    async def async_authenticate(self, entry_id: str | None = None) -> None:
+        """Log in, unless the session or a token saved for the entry is still valid."""
+        async with self._auth_lock:
+            if self.auth.is_access_token_valid():
+                return
+            if entry_id is not None and not self._restored:
+                self._restored = True
+                await async_load_auth(self.hass, entry_id, self.auth)
+                if self.auth.is_access_token_valid():
+                    return
+
+            async def do_auth() -> None:
+                """Log in, without counting a rejected password as a failed call."""
+                # do_auth uses a saved refresh token before a password login
+                await self.auth.do_auth(store=False)
+
+            await self.limiter.async_call(CallPriority.RESYNC, do_auth)
+            if entry_id is not None and self.auth.is_access_token_valid():
+                await async_save_auth(self.hass, entry_id, self.auth)
+
+    async def async_fetch_appliances(self) -> AppliancesManager | None:
+        """Fetch the appliances, reusing a recent fetch."""
+        async with self._fetch_lock:
+            if (
+                self._appliances is not None
+                and time.monotonic() - self._fetched_at < APPLIANCES_CACHE_TIME
+            ):
+                return self._appliances
+
+            # The library appends to its lists on every fetch, so use a new manager
+            appliances = AppliancesManager(
+                self.backend_selector, self.auth, self.session
+            )
+            complete = False
+
+            async def fetch_appliances() -> bool:
+                """Fetch the owned and the shared appliances, noting if one failed."""
+                nonlocal complete
+                # AppliancesManager.fetch_appliances succeeds when either list does,
+                # which would make a failed list look like removed appliances
+                if not (account_id := await self.auth.get_account_id()):
+                    return False
+                owned = await appliances._get_owned_appliances(account_id)
+                shared = await appliances._get_shared_appliances()
+                complete = owned and shared
+                return owned or shared
+
+            if not await self.limiter.async_call(
+                CallPriority.RESYNC, fetch_appliances, cost=2, success=bool
+            ):
+                return None
+            self._appliances = appliances
+            self._fetched_at = time.monotonic()
+            self.appliances_complete = complete
+            return appliances
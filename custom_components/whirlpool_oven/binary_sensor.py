@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from whirlpool.oven import Cavity
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
+    BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_OVEN, DOMAIN
+from .const import ATTR_DOOR_OPEN
 from .device import WhirlpoolOvenDevice
-from .entity import WhirlpoolEntity
+from .entity import (
+    WhirlpoolCavityEntity,
+    WhirlpoolCavityEntityDescription,
+    async_setup_cavity_entities,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WhirlpoolBinarySensorEntityDescription(
+    WhirlpoolCavityEntityDescription, BinarySensorEntityDescription
+):
+    """Describes a Whirlpool oven cavity binary sensor."""
+
+
+CAVITY_BINARY_SENSORS: tuple[WhirlpoolBinarySensorEntityDescription, ...] = (
+    WhirlpoolBinarySensorEntityDescription(
+        key="door",
+        name="door",
+        device_class=BinarySensorDeviceClass.DOOR,
+        device_attribute=ATTR_DOOR_OPEN,
+        value_fn=lambda device, cavity: device.is_door_open(cavity),
+    ),
+)
 
 
 async def async_setup_entry(
@@ -23,41 +48,32 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Whirlpool Appliances binary sensors from config entry."""
-
-    for oven_device in hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN].values():
-        oven_device: WhirlpoolOvenDevice
-        oven_entities = []
-        cavities = []
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Upper):
-            cavities.append(Cavity.Upper)
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Lower):
-            cavities.append(Cavity.Lower)
-
-        for cavity in cavities:
-            oven_entities.extend(
-                [
-                    WhirpoolOvenCavityDoorBinarySensor(oven_device, cavity),
-                ]
-            )
-        async_add_entities(oven_entities)
+    async_setup_cavity_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda oven_device, cavity: (
+            WhirpoolOvenCavityBinarySensor(oven_device, cavity, description)
+            for description in CAVITY_BINARY_SENSORS
+        ),
+    )
 
 
-class WhirpoolOvenCavityDoorBinarySensor(WhirlpoolEntity, BinarySensorEntity):
-    """State of an oven cavity door."""
+class WhirpoolOvenCavityBinarySensor(WhirlpoolCavityEntity, BinarySensorEntity):
+    """Binary sensor of an oven cavity."""
 
-    _attr_device_class = BinarySensorDeviceClass.DOOR
+    entity_description: WhirlpoolBinarySensorEntityDescription
 
-    def __init__(self, device: WhirlpoolOvenDevice, cavity: Cavity) -> None:
-        """Initialize the cavity door binary sensor."""
-        self.cavity = cavity
-        super().__init__(device)
-
-    @property
-    def name(self) -> str:
-        """Return name of the binary sensor."""
-        return f"{self.device.get_cavity_name(self.cavity)} door"
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        cavity: Cavity,
+        description: WhirlpoolBinarySensorEntityDescription,
+    ) -> None:
+        """Initialize the cavity binary sensor."""
+        super().__init__(device, cavity, description)
 
     @property
-    def is_on(self):
-        """Return true if the cavity door is open."""
-        return self.device.is_door_open(self.cavity)
+    def is_on(self) -> bool | None:
+        """Return true if the binary sensor is on."""
+        return self.value
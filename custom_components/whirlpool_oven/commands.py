@@ -0,0 +1,110 @@
+"""Command pipelines for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from whirlpool.oven import Cavity
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import ATTR_LIGHT_ON, LIGHT_CONFIRM_TIMEOUT, LOGGER
+
+if TYPE_CHECKING:
+    from .device import WhirlpoolOvenDevice
+
+
+class LightCommandQueue:
+    """Send the light commands of an oven cavity one at a time, optimistically."""
+
+    def __init__(self, device: WhirlpoolOvenDevice, cavity: Cavity) -> None:
+        """Initialize the queue."""
+        self.device = device
+        self.cavity = cavity
+        self.optimistic: bool | None = None
+        self._in_flight: bool | None = None
+        self._pending: bool | None = None
+        self._sent_at: float | None = None
+        self._cancel_timeout: CALLBACK_TYPE | None = None
+        device.register_callback(self._handle_light_update, cavity, (ATTR_LIGHT_ON,))
+
+    async def async_set(self, on: bool) -> bool:
+        """Set the light, showing the new state until the oven confirms it.
+
+        Returns False when the state was left to the command already being sent,
+        which sends it after its own state, or drops it if that state is the same.
+        """
+        if self._in_flight is None:
+            # Nothing of this state was sent yet, so an oven report cannot confirm it
+            self._sent_at = None
+        self._async_set_optimistic(on)
+        if self._in_flight is not None:
+            # Only the latest state matters; a repeat of the running command is dropped
+            self._pending = None if on == self._in_flight else on
+            return False
+
+        self._pending = on
+        try:
+            while self._pending is not None:
+                self._in_flight, self._pending = self._pending, None
+                self._sent_at = time.monotonic()
+                await self.device.async_send_light(self._in_flight, self.cavity)
+        except Exception:
+            self._async_set_optimistic(None)
+            raise
+        finally:
+            self._in_flight = None
+
+        self._handle_light_update()
+        if self.optimistic is not None:
+            self._cancel_timeout = async_call_later(
+                self.device.hass, LIGHT_CONFIRM_TIMEOUT, self._async_timeout
+            )
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop waiting for the oven to confirm a light change."""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+        self.device.unregister_callback(
+            self._handle_light_update, self.cavity, (ATTR_LIGHT_ON,)
+        )
+
+    @callback
+    def _handle_light_update(self) -> None:
+        """Confirm the optimistic state once the oven reports it."""
+        if (
+            self.optimistic is None
+            or self._in_flight is not None
+            or self._sent_at is None
+            or self.device.is_light_on(self.cavity) != self.optimistic
+        ):
+            return
+        self.device.metrics.confirmation_latency.record(
+            time.monotonic() - self._sent_at
+        )
+        self._async_set_optimistic(None)
+
+    @callback
+    def _async_timeout(self, _now: Any) -> None:
+        """Roll back an optimistic state the oven did not confirm."""
+        self._cancel_timeout = None
+        LOGGER.warning(
+            f"{self.device.appliance_data.name} did not confirm the light change, "
+            "reverting it"
+        )
+        self._async_set_optimistic(None)
+
+    @callback
+    def _async_set_optimistic(self, on: bool | None) -> None:
+        """Set the optimistic state and update the light entity."""
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+        if on != self.optimistic:
+            self.optimistic = on
+            self.device.async_notify(self.cavity, ATTR_LIGHT_ON)
@@ -8,16 +8,28 @@ from typing import Any
 
 from aiohttp import ClientError
 import voluptuous as vol
-from whirlpool.appliancesmanager import AppliancesManager
-from whirlpool.auth import Auth
-from whirlpool.backendselector import BackendSelector
 
 from homeassistant import config_entries, core, exceptions
 from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_BRAND, CONF_BRANDS_MAP, CONF_REGION_MAP, DOMAIN, LOGGER
+from .account import WhirlpoolAccount
+from .const import (
+    CONF_BRAND,
+    CONF_BRANDS_MAP,
+    CONF_RECORD_TRAFFIC,
+    CONF_REGION_MAP,
+    CONF_TEMPERATURE_DELTA,
+    CONF_TEMPERATURE_INTERVAL,
+    CONF_UPDATE_WINDOW,
+    DEFAULT_TEMPERATURE_DELTA,
+    DEFAULT_TEMPERATURE_INTERVAL,
+    DEFAULT_UPDATE_WINDOW,
+    DOMAIN,
+    LOGGER,
+)
+from .storage import async_save_auth
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -38,26 +50,27 @@ REAUTH_SCHEMA = vol.Schema(
 
 async def validate_input(
     hass: core.HomeAssistant, data: dict[str, str]
-) -> dict[str, str]:
+) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    session = async_get_clientsession(hass)
-    region = CONF_REGION_MAP[data[CONF_REGION]]
-    brand = CONF_BRANDS_MAP[data[CONF_BRAND]]
-    backend_selector = BackendSelector(brand, region)
-    auth = Auth(backend_selector, data[CONF_USERNAME], data[CONF_PASSWORD], session)
+    account = WhirlpoolAccount(hass, data)
     try:
-        await auth.do_auth()
+        await account.async_authenticate()
     except (TimeoutError, ClientError) as exc:
         raise CannotConnect from exc
 
-    if not auth.is_access_token_valid():
+    if not account.auth.is_access_token_valid():
         raise InvalidAuth
 
-    appliances_manager = AppliancesManager(backend_selector, auth, session)
-    await appliances_manager.fetch_appliances()
+    try:
+        appliances_manager = await account.async_fetch_appliances()
+    except (TimeoutError, ClientError) as exc:
+        # Also raised while the cloud call circuit breaker is open
+        raise CannotConnect from exc
+    if appliances_manager is None:
+        raise CannotConnect
     if (
         appliances_manager.aircons is None
         and appliances_manager.washer_dryers is None
@@ -65,7 +78,7 @@ async def validate_input(
     ):
         raise NoAppliances
 
-    return {"title": data[CONF_USERNAME]}
+    return {"title": data[CONF_USERNAME], "auth": account.auth}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -74,6 +87,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     entry: config_entries.ConfigEntry | None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_reauth(self, entry_data: Mapping[str, Any]) -> FlowResult:
         """Handle re-authentication with Whirlpool Sixth Sense."""
 
@@ -97,12 +118,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
 
             try:
-                await validate_input(self.hass, data)
+                info = await validate_input(self.hass, data)
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
             except (CannotConnect, TimeoutError):
                 errors["base"] = "cannot_connect"
             else:
+                await async_save_auth(self.hass, self.entry.entry_id, info["auth"])
                 self.hass.config_entries.async_update_entry(self.entry, data=data)
                 await self.hass.config_entries.async_reload(self.entry.entry_id)
                 return self.async_abort(reason="reauth_successful")
@@ -145,6 +167,50 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Whirlpool Appliances options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_TEMPERATURE_DELTA,
+                        default=options.get(
+                            CONF_TEMPERATURE_DELTA, DEFAULT_TEMPERATURE_DELTA
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_TEMPERATURE_INTERVAL,
+                        default=options.get(
+                            CONF_TEMPERATURE_INTERVAL, DEFAULT_TEMPERATURE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_UPDATE_WINDOW,
+                        default=options.get(CONF_UPDATE_WINDOW, DEFAULT_UPDATE_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                    vol.Required(
+                        CONF_RECORD_TRAFFIC,
+                        default=options.get(CONF_RECORD_TRAFFIC, False),
+                    ): bool,
+                }
+            ),
+        )
+
+
 class CannotConnect(exceptions.HomeAssistantError):
     """Error to indicate we cannot connect."""
 
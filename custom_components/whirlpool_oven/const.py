@@ -1,20 +1,100 @@
 """Constants for the Whirlpool Appliances integration."""
 
+from datetime import timedelta
 import logging
 from typing import Final
 
 from whirlpool.backendselector import Brand, Region
-from whirlpool.oven import CavityState, CookMode
 
 DOMAIN: Final = "whirlpool_oven"
+DATA_RATE_LIMITER: Final = f"{DOMAIN}_rate_limiter"
 
 LOGGER = logging.getLogger(__package__)
 
+CONF_ACCOUNT: Final = "account"
+CONF_APPLIANCES: Final = "appliances"
 CONF_BRAND: Final = "brand"
+CONF_INVENTORY_LOCK: Final = "inventory_lock"
+CONF_MISSING: Final = "missing"
 CONF_OVEN: Final = "oven"
+CONF_PLATFORMS: Final = "platforms"
+CONF_SCHEDULER: Final = "scheduler"
+CONF_SESSIONS: Final = "sessions"
 CONF_LAUNDRY: Final = "laundry"
 CONF_AIRCON: Final = "aircon"
 
+CONF_TEMPERATURE_DELTA: Final = "temperature_delta"
+CONF_TEMPERATURE_INTERVAL: Final = "temperature_interval"
+CONF_UPDATE_WINDOW: Final = "update_window"
+CONF_RECORD_TRAFFIC: Final = "record_traffic"
+CONF_TRAFFIC_RECORDER: Final = "traffic_recorder"
+
+DEFAULT_TEMPERATURE_DELTA: Final = 1.0
+DEFAULT_TEMPERATURE_INTERVAL: Final = 10
+# Milliseconds to collect a burst of push updates before updating entities
+DEFAULT_UPDATE_WINDOW: Final = 50
+
+# Seconds a burst of push updates may hold back entity updates at most
+UPDATE_MAX_DELAY: Final = 0.25
+
+# Seconds a first setup waits for all ovens together to connect, on top of the time
+# the rate limiter needs for their requests; ovens that are still connecting then
+# continue in the background
+CONNECT_TIMEOUT: Final = 15
+
+# Appliance lists fetched within this many seconds are reused by the setup and
+# the background discovery of an entry
+APPLIANCES_CACHE_TIME: Final = 60
+
+KEEP_ALIVE_INTERVAL: Final = timedelta(minutes=5)
+
+# Interval to check the account for added or removed ovens
+DISCOVERY_INTERVAL: Final = timedelta(hours=1)
+# Complete appliance lists in a row that must miss an oven before it is retired
+RETIRE_AFTER_MISSES: Final = 3
+
+# Seconds to wait for the oven to report a light change before reverting it
+LIGHT_CONFIRM_TIMEOUT: Final = 15
+
+# Cloud calls per second shared by all ovens, and the calls allowed in a burst
+CLOUD_CALL_RATE: Final = 2.0
+CLOUD_CALL_BURST: Final = 10
+# Requests made to connect an oven: a data fetch, the websocket URL, the websocket
+# itself and a second data fetch once the websocket is up
+CONNECT_CALL_COST: Final = 4
+
+# Failed cloud calls in a row that pause all calls, and the pause in seconds
+BREAKER_FAILURES: Final = 5
+BREAKER_COOLDOWN: Final = 60
+
+RECONNECT_MIN_DELAY: Final = 5
+RECONNECT_MAX_DELAY: Final = 300
+RECONNECT_TIMEOUT: Final = 60
+
+# Delay after the last held back temperature update before it is published anyway
+TEMPERATURE_SETTLE_TIME: Final = 5
+
+# Seconds to collect cook session changes before saving them
+COOK_SESSIONS_SAVE_DELAY: Final = 10
+
+# Temperature samples kept per cavity to estimate the end of a preheat
+PREHEAT_SAMPLES: Final = 32
+PREHEAT_MIN_SAMPLES: Final = 3
+
+SIGNAL_DEVICE_CONNECTED: Final = f"{DOMAIN}_device_connected_{{}}"
+SIGNAL_DEVICE_CHANGED: Final = f"{DOMAIN}_device_changed"
+SIGNAL_DEVICE_ADDED: Final = f"{DOMAIN}_device_added_{{}}"
+
+# Size in bytes at which the push traffic log is rotated, and the old logs kept
+TRAFFIC_LOG_MAX_BYTES: Final = 5_000_000
+TRAFFIC_LOG_BACKUPS: Final = 2
+
+# Commands a bulk command service call sends at the same time by default
+BULK_COMMAND_CONCURRENCY: Final = 4
+
+# Default seconds to collect changes before sending them to a websocket subscriber
+WEBSOCKET_BATCH_WINDOW: Final = 0.5
+
 
 CONF_BRANDS_MAP: Final = {
     "Whirlpool": Brand.Whirlpool,
@@ -37,22 +117,33 @@ OVEN_CAVITY_NAME_LOWER_H: Final = "Left oven"
 OVEN_CAVITY_NAME_UPPER: Final = "Upper oven"
 OVEN_CAVITY_NAME_UPPER_H: Final = "Right oven"
 
+ATTR_ONLINE: Final = "online"
+ATTR_CAVITY_STATE: Final = "cavity_state"
+ATTR_COOK_MODE: Final = "cook_mode"
+ATTR_CURRENT_TEMPERATURE: Final = "current_temperature"
+ATTR_TARGET_TEMPERATURE: Final = "target_temperature"
+ATTR_DOOR_OPEN: Final = "door_open"
+ATTR_LIGHT_ON: Final = "light_on"
+ATTR_COOK_SESSIONS: Final = "cook_sessions"
+
+# Keyed by the names of the library enums, so the config flow does not import the
+# oven module of the library
 OVEN_CAVITY_STATES: Final = {
-    CavityState.Standby: "standby",
-    CavityState.Preheating: "preheating",
-    CavityState.Cooking: "cooking",
-    CavityState.NotPresent: "not_present",
+    "Standby": "standby",
+    "Preheating": "preheating",
+    "Cooking": "cooking",
+    "NotPresent": "not_present",
 }
 
 OVEN_COOK_MODES: Final = {
-    CookMode.Standby: "standby",
-    CookMode.Bake: "bake",
-    CookMode.ConvectBake: "convection_bake",
-    CookMode.Broil: "broil",
-    CookMode.ConvectBroil: "convection_broil",
-    CookMode.ConvectRoast: "convection_roast",
-    CookMode.KeepWarm: "keep_warm",
-    CookMode.AirFry: "air_fry",
+    "Standby": "standby",
+    "Bake": "bake",
+    "ConvectBake": "convection_bake",
+    "Broil": "broil",
+    "ConvectBroil": "convection_broil",
+    "ConvectRoast": "convection_roast",
+    "KeepWarm": "keep_warm",
+    "AirFry": "air_fry",
 }
 
 OVEN_MODELS_HORIZONTAL: Final = ["KFDC558JSS", "KFGC558JSS"]
@@ -2,22 +2,37 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
-from aiohttp import ClientSession
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from functools import partial
+import time
+from typing import Any, TypeVar
+
+from aiohttp import ClientError, ClientSession
 from whirlpool.auth import Auth
 from whirlpool.backendselector import BackendSelector
-from whirlpool.oven import Cavity, Oven
+from whirlpool.oven import (
+    ATTR_POSTFIX_LIGHT_STATUS,
+    CAVITY_PREFIX_MAP,
+    Cavity,
+    Oven,
+)
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    ATTR_ONLINE,
     BRAND_AMANA,
     BRAND_KITCHENAID,
     BRAND_MAYTAG,
     BRAND_WHIRLPOOL,
+    CONNECT_CALL_COST,
+    DEFAULT_UPDATE_WINDOW,
     DOMAIN,
     LOGGER,
     OVEN_CAVITY_NAME_LOWER,
@@ -28,7 +43,18 @@ from .const import (
     OVEN_CAVITY_STATES,
     OVEN_COOK_MODES,
     OVEN_MODELS_HORIZONTAL,
+    RECONNECT_TIMEOUT,
+    SIGNAL_DEVICE_CHANGED,
+    SIGNAL_DEVICE_CONNECTED,
+    UPDATE_MAX_DELAY,
 )
+from .commands import LightCommandQueue
+from .metrics import DeviceMetrics, Histogram
+from .ratelimit import CallPriority, async_get_rate_limiter
+from .sessions import CookSessionStats
+from .supervisor import ConnectionSupervisor
+
+_T = TypeVar("_T")
 
 
 def get_brand_from_model(model_number: str) -> str:
@@ -48,6 +74,15 @@ def get_brand_from_model(model_number: str) -> str:
 class WhirpoolApplianceData:
     """Class for Whirlpool API appliance data."""
 
+    __slots__ = (
+        "category",
+        "data_model",
+        "model_number",
+        "name",
+        "said",
+        "serial_number",
+    )
+
     def __init__(self, appliance_data: dict[str, str]) -> None:
         """Convert dict to properties."""
         self.said = appliance_data.get("SAID")
@@ -57,6 +92,32 @@ class WhirpoolApplianceData:
         self.model_number = appliance_data.get("MODEL_NUMBER")
         self.serial_number = appliance_data.get("SERIAL_NUMBER")
 
+    def as_dict(self) -> dict[str, str]:
+        """Convert properties back to the Whirlpool API dict."""
+        return {
+            "SAID": self.said,
+            "NAME": self.name,
+            "DATA_MODEL": self.data_model,
+            "CATEGORY": self.category,
+            "MODEL_NUMBER": self.model_number,
+            "SERIAL_NUMBER": self.serial_number,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CavitySnapshot:
+    """Values of an oven cavity exposed by entities, with enums already mapped."""
+
+    cavity_state: str | None = None
+    cook_mode: str | None = None
+    current_temperature: float | None = None
+    target_temperature: float | None = None
+    door_open: bool | None = None
+    light_on: bool | None = None
+
+
+EMPTY_CAVITY_SNAPSHOT = CavitySnapshot()
+
 
 class WhirlpoolOvenDevice(DataUpdateCoordinator):
     """Oven device data."""
@@ -68,6 +129,8 @@ class WhirlpoolOvenDevice(DataUpdateCoordinator):
         backend_selector: BackendSelector,
         auth: Auth,
         session: ClientSession,
+        cavities: list[Cavity] | None = None,
+        update_window: float = DEFAULT_UPDATE_WINDOW / 1000,
     ) -> None:
         """Initialize the device."""
         self.hass: HomeAssistant = hass
@@ -75,6 +138,33 @@ class WhirlpoolOvenDevice(DataUpdateCoordinator):
         self.backend_selector: BackendSelector = backend_selector
         self.auth: Auth = auth
         self.session: ClientSession = session
+        self.connected: bool = False
+        self.last_update: float = 0.0
+        self.last_push: float = 0.0
+        self.cavities: list[Cavity] | None = None
+        self.cavity_names: dict[Cavity, str] = {}
+        self.cavities_are_horizontal: bool = any(
+            horizontal_model in (appliance_data.model_number or "")
+            for horizontal_model in OVEN_MODELS_HORIZONTAL
+        )
+        if cavities is not None:
+            self._set_cavities(cavities)
+        self.metrics = DeviceMetrics()
+        self.limiter = async_get_rate_limiter(hass)
+        self._light_queues: dict[Cavity, LightCommandQueue] = {}
+        self.cook_sessions: dict[Cavity, CookSessionStats] = {}
+
+        # The last values exposed by entities, used to only notify entities that change
+        self._online: bool = False
+        self._snapshot: dict[Cavity, CavitySnapshot] = {}
+        self._listeners: dict[tuple[Cavity, str], list[Callable[[], None]]] = {}
+
+        # Push updates arriving in a burst are collected into one entity update
+        self.update_window = update_window
+        self._burst = 0
+        self._burst_started = 0.0
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
         self.oven: Oven = Oven(
             backend_selector,
             auth,
@@ -84,9 +174,15 @@ class WhirlpoolOvenDevice(DataUpdateCoordinator):
 
         # Register for the updates provided by the Whirlpool API
         self.oven.register_attr_callback(self.on_update)
+        self._watch_push_messages()
 
-        # Create a periodic keep-alive call to prevent the API connection from going stale
-        async_track_time_interval(self.hass, self.keep_alive, timedelta(minutes=5))
+        # Watch the push connection and reconnect it when it stops working
+        self.supervisor = ConnectionSupervisor(
+            hass,
+            f"{DOMAIN}-{self.appliance_data.said}",
+            self._async_connect,
+            self._async_disconnect,
+        )
 
         super().__init__(
             hass,
@@ -96,43 +192,271 @@ class WhirlpoolOvenDevice(DataUpdateCoordinator):
 
     async def connect(self) -> None:
         """Listen for oven events."""
-        await self.oven.connect()
+        await self.supervisor.async_start()
+
+    async def disconnect(self) -> None:
+        """Stop listening for oven events and release the timers and callbacks."""
+        await self.supervisor.async_stop()
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        for light_queue in self._light_queues.values():
+            light_queue.async_stop()
+        self._light_queues.clear()
+        # The library keeps its callbacks, and with them this device, until removed
+        self.oven.unregister_attr_callback(self.on_update)
+
+    async def _async_connect(self) -> None:
+        """Connect to the oven event listener, which also fetches the oven data."""
+        requested = time.monotonic()
+        # The library does not report a failed data fetch while connecting, but only
+        # a successful fetch calls on_update
+        await self.limiter.async_call(
+            CallPriority.RESYNC,
+            self._async_connect_oven,
+            cost=CONNECT_CALL_COST,
+            success=lambda _: self.last_update >= requested,
+        )
+        if self.cavities is None:
+            if not self._oven_has_data():
+                # Without data the oven would seem to have no cavities; keep them
+                # unknown and let the supervisor retry
+                raise ClientError(f"No data received for {self.appliance_data.name}")
+            self._set_cavities(self.detect_cavities())
+            self._snapshot = self._read_snapshot()
+            async_dispatcher_send(self.hass, self.signal_connected, self)
+
+    async def _async_connect_oven(self) -> None:
+        """Connect the library to the oven, once the rate limiter let the call through."""
+        # Only the connection is timed, the wait for the rate limiter can be long
+        async with asyncio.timeout(RECONNECT_TIMEOUT):
+            await self.oven.connect()
+
+    async def _async_disconnect(self) -> None:
+        """Disconnect from the oven event listener."""
+        if self._oven_is_listening():
+            await self.oven.disconnect()
+
+    # The library has no public API for the state of its push channel; these
+    # helpers are the only places that read or wrap its private attributes
+
+    def _oven_has_data(self) -> bool:
+        """Return True once the library has fetched the oven data."""
+        # Every attribute read logs an error before the library has data
+        return getattr(self.oven, "_data_dict", None) is not None
+
+    def _oven_is_listening(self) -> bool:
+        """Return True if the library started its event listener."""
+        # The library fails to stop an event listener that was never started
+        return getattr(self.oven, "_event_socket", None) is not None
+
+    def push_channel_dropped(self) -> bool:
+        """Return True if the event listener of the library stopped on its own."""
+        # The library reconnects its socket itself, so its task only ends on an error
+        socket = getattr(self.oven, "_event_socket", None)
+        run_task = getattr(socket, "_run_future", None)
+        return run_task is not None and run_task.done()
+
+    def _watch_push_messages(self) -> None:
+        """Record when the push channel of the oven last delivered a message."""
+        handler = getattr(self.oven, "_event_socket_handler", None)
+        if handler is None:
+            LOGGER.warning(
+                f"Unable to watch the push channel of {self.appliance_data.name}"
+            )
+            return
+
+        # The library hands its event socket the handler when it connects
+        def on_push(msg: str) -> None:
+            self.last_push = time.monotonic()
+            handler(msg)
+
+        self.oven._event_socket_handler = on_push
+
+    @property
+    def signal_connected(self) -> str:
+        """Return the dispatcher signal sent once the oven cavities are known."""
+        return SIGNAL_DEVICE_CONNECTED.format(self.appliance_data.said)
 
     def on_update(self) -> None:
         """Handle oven data update callbacks."""
+        # Runs ahead of the entity callbacks, so they see the oven as available
+        self.connected = True
+        self.last_update = time.monotonic()
+        self.metrics.push_events += 1
         LOGGER.debug(f"Oven data for {self.appliance_data.name} has been updated")
+        if self.update_window <= 0:
+            self.metrics.burst_size.record(1)
+            self._update_listeners()
+            return
+
+        self._burst += 1
+        if self._cancel_flush is None:
+            self._burst_started = self.last_update
+        else:
+            self._cancel_flush()
+        # Wait for the burst to end, but not past the maximum delay from its start
+        delay = min(
+            self.update_window,
+            self._burst_started + UPDATE_MAX_DELAY - self.last_update,
+        )
+        self._cancel_flush = async_call_later(
+            self.hass, max(delay, 0), self._async_flush_updates
+        )
 
-    async def keep_alive(self, trigger: datetime) -> None:
-        """Listen for oven events."""
-        LOGGER.debug("Keeping the API connection alive")
-        await self.oven.fetch_data()
+    @callback
+    def _async_flush_updates(self, _now: Any) -> None:
+        """Update the entities once for a burst of push updates."""
+        self._cancel_flush = None
+        self.metrics.burst_size.record(self._burst)
+        self._burst = 0
+        self._update_listeners()
+
+    def _update_listeners(self) -> None:
+        """Call the callbacks of the values that changed since the last update."""
+        online = self.connected and bool(self.oven.get_online())
+        snapshot = self._read_snapshot()
+        changed: set[tuple[Cavity | None, str]] = set()
+        for cavity, values in snapshot.items():
+            previous = self._snapshot.get(cavity)
+            if previous is None:
+                changed.update(
+                    (cavity, attribute) for attribute in CavitySnapshot.__slots__
+                )
+            elif values != previous:
+                changed.update(
+                    (cavity, attribute)
+                    for attribute in CavitySnapshot.__slots__
+                    if getattr(values, attribute) != getattr(previous, attribute)
+                )
+        if online != self._online:
+            notify = set(self._listeners)
+            changed.add((None, ATTR_ONLINE))
+        else:
+            notify = changed
+        self._online = online
+        self._snapshot = snapshot
+
+        callbacks = {fn for key in notify for fn in self._listeners.get(key, ())}
+        self.metrics.notifications += len(callbacks)
+        for fn in callbacks:
+            fn()
+
+        if changed:
+            async_dispatcher_send(self.hass, SIGNAL_DEVICE_CHANGED, self, changed)
+
+    def _read_snapshot(self) -> dict[Cavity, CavitySnapshot]:
+        """Return the values exposed by entities for each cavity."""
+        if not self.connected:
+            return {}
+        return {cavity: self._read_cavity(cavity) for cavity in self.cavities or ()}
+
+    def _read_cavity(self, cavity: Cavity) -> CavitySnapshot:
+        """Read the values of a cavity from the library."""
+        cavity_state = self.oven.get_cavity_state(cavity)
+        cook_mode = self.oven.get_cook_mode(cavity)
+        current_temperature = self.oven.get_temp(cavity)
+        target_temperature = self.oven.get_target_temp(cavity)
+        return CavitySnapshot(
+            cavity_state=None
+            if cavity_state is None
+            else OVEN_CAVITY_STATES.get(cavity_state.name),
+            cook_mode=None
+            if cook_mode is None
+            else OVEN_COOK_MODES.get(cook_mode.name),
+            current_temperature=current_temperature or None,
+            target_temperature=target_temperature or None,
+            door_open=self.oven.get_door_opened(cavity),
+            light_on=self.oven.get_light(cavity),
+        )
 
-    def register_callback(self, fn: callable):
-        """Register a callback for oven updates."""
-        self.oven.register_attr_callback(fn)
+    def snapshot(self, cavity: Cavity) -> CavitySnapshot:
+        """Return the last values of an oven cavity."""
+        return self._snapshot.get(cavity, EMPTY_CAVITY_SNAPSHOT)
 
-    def unregister_callback(self, fn: callable):
-        """Unregister a callback for oven updates."""
-        self.oven.unregister_attr_callback(fn)
+    async def keep_alive(self) -> None:
+        """Fetch the oven data to prevent the API connection from going stale."""
+        LOGGER.debug("Keeping the API connection alive")
+        try:
+            fetched = await self.limiter.async_call(
+                CallPriority.KEEP_ALIVE,
+                partial(
+                    self._async_timed,
+                    self.metrics.keep_alive_latency,
+                    self.oven.fetch_data,
+                ),
+                success=bool,
+            )
+        except (ClientError, TimeoutError):
+            fetched = False
+        if not fetched:
+            self.connected = False
+            self._update_listeners()
+            self.supervisor.async_mark_stale()
+
+    async def _async_timed(
+        self, histogram: Histogram, call: Callable[..., Awaitable[_T]], *args: Any
+    ) -> _T:
+        """Make a cloud call, recording its round trip without the rate limiter wait."""
+        start = time.monotonic()
+        try:
+            return await call(*args)
+        finally:
+            histogram.record(time.monotonic() - start)
+
+    def detect_cavities(self) -> list[Cavity]:
+        """Return the cavities reported by the oven."""
+        return [cavity for cavity in Cavity if self.oven.get_oven_cavity_exists(cavity)]
+
+    def detect_platforms(self) -> set[Platform]:
+        """Return the platforms with entities for the features reported by the oven."""
+        platforms = {Platform.SENSOR}
+        for cavity in self.detect_cavities():
+            if self.oven.get_door_opened(cavity) is not None:
+                platforms.add(Platform.BINARY_SENSOR)
+            if self.oven.get_light(cavity) is not None:
+                platforms.add(Platform.LIGHT)
+        return platforms
+
+    @callback
+    def async_notify(self, cavity: Cavity, attribute: str) -> None:
+        """Call the callbacks of an attribute of a cavity."""
+        for fn in list(self._listeners.get((cavity, attribute), ())):
+            fn()
+
+    def register_callback(
+        self, fn: Callable[[], None], cavity: Cavity, attributes: Iterable[str]
+    ) -> None:
+        """Register a callback for changes to attributes of a cavity."""
+        for attribute in attributes:
+            self._listeners.setdefault((cavity, attribute), []).append(fn)
+
+    def unregister_callback(
+        self, fn: Callable[[], None], cavity: Cavity, attributes: Iterable[str]
+    ) -> None:
+        """Unregister a callback for changes to attributes of a cavity."""
+        for attribute in attributes:
+            listeners = self._listeners.get((cavity, attribute), [])
+            if fn in listeners:
+                listeners.remove(fn)
+            if not listeners:
+                self._listeners.pop((cavity, attribute), None)
 
     @property
     def has_multiple_cavities(self) -> bool:
         """True if the oven has multiple cavities."""
-        if self.oven.get_oven_cavity_exists(
-            Cavity.Upper
-        ) and self.oven.get_oven_cavity_exists(Cavity.Lower):
-            return True
-        return False
+        return self.cavities is not None and len(self.cavities) > 1
 
-    @property
-    def cavities_are_horizontal(self) -> bool:
-        """True if the oven has multiple cavities in a horizontal layout."""
-        for horizontal_model in OVEN_MODELS_HORIZONTAL:
-            if horizontal_model in self.appliance_data.model_number:
-                return True
-        return False
+    def _set_cavities(self, cavities: list[Cavity]) -> None:
+        """Set the cavities of the oven and work out their names."""
+        self.cavities = cavities
+        self.cavity_names = {cavity: self._cavity_name(cavity) for cavity in cavities}
 
     def get_cavity_name(self, cavity: Cavity) -> str:
+        """Return the name of a cavity."""
+        return self.cavity_names[cavity]
+
+    def _cavity_name(self, cavity: Cavity) -> str:
         """Return the name of a cavity, based on number of cavities and orientation."""
         name = OVEN_CAVITY_NAME_SINGLE
         if self.has_multiple_cavities:
@@ -151,40 +475,59 @@ class WhirlpoolOvenDevice(DataUpdateCoordinator):
     @property
     def is_online(self) -> bool:
         """Return the online status of the oven."""
-        return self.oven.get_online() | False
+        return self._online
 
     def cavity_state(self, cavity: Cavity) -> str:
         """Return the state of an oven cavity."""
-        state = self.oven.get_cavity_state(cavity)
-        return OVEN_CAVITY_STATES.get(state)
+        return self.snapshot(cavity).cavity_state
 
     def cook_mode(self, cavity: Cavity) -> str:
         """Return the mode of an oven cavity."""
-        mode = self.oven.get_cook_mode(cavity)
-        return OVEN_COOK_MODES.get(mode)
+        return self.snapshot(cavity).cook_mode
 
     def current_temperature(self, cavity: Cavity) -> float:
         """Return the current temperature of an oven cavity."""
-        temp = self.oven.get_temp(cavity)
-        return temp if temp != 0 else None
+        return self.snapshot(cavity).current_temperature
 
     def target_temperature(self, cavity: Cavity) -> float:
         """Return the target temperature of an oven cavity."""
-        temp = self.oven.get_target_temp(cavity)
-        return temp if temp != 0 else None
+        return self.snapshot(cavity).target_temperature
 
     def is_door_open(self, cavity: Cavity) -> bool:
         """Return True if an oven cavity door is open."""
-        return self.oven.get_door_opened(cavity)
+        return self.snapshot(cavity).door_open
 
     def is_light_on(self, cavity: Cavity) -> bool:
         """Return True if an oven cavity light is on."""
-        return self.oven.get_light(cavity)
-
-    async def turn_on_light(self, cavity: Cavity) -> None:
-        """Turn on an oven cavity light."""
-        await self.oven.set_light(True, cavity)
-
-    async def turn_off_light(self, cavity: Cavity) -> None:
-        """Turn off an oven cavity light."""
-        await self.oven.set_light(False, cavity)
+        return self.snapshot(cavity).light_on
+
+    def light_queue(self, cavity: Cavity) -> LightCommandQueue:
+        """Return the light command queue of an oven cavity."""
+        if cavity not in self._light_queues:
+            self._light_queues[cavity] = LightCommandQueue(self, cavity)
+        return self._light_queues[cavity]
+
+    async def turn_on_light(self, cavity: Cavity) -> bool:
+        """Turn on an oven cavity light, returning False if a command was in flight."""
+        return await self.light_queue(cavity).async_set(True)
+
+    async def turn_off_light(self, cavity: Cavity) -> bool:
+        """Turn off an oven cavity light, returning False if a command was in flight."""
+        return await self.light_queue(cavity).async_set(False)
+
+    async def async_send_light(self, on: bool, cavity: Cavity) -> None:
+        """Set an oven cavity light, recording the command round trip."""
+        # Oven.set_light drops the result of the request, so send its attribute here
+        attribute = f"{CAVITY_PREFIX_MAP[cavity]}_{ATTR_POSTFIX_LIGHT_STATUS}"
+        sent = await self.limiter.async_call(
+            CallPriority.COMMAND,
+            partial(
+                self._async_timed,
+                self.metrics.command_latency,
+                self.oven.send_attributes,
+                {attribute: self.oven.bool_to_attr_value(on)},
+            ),
+            success=bool,
+        )
+        if not sent:
+            raise ClientError(f"Unable to set the light of {self.appliance_data.name}")
@@ -0,0 +1,61 @@
+"""Diagnostics support for Whirlpool Appliances."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_OVEN, CONF_SCHEDULER, DOMAIN
+from .device import WhirlpoolOvenDevice
+from .ratelimit import async_get_rate_limiter
+from .scheduler import KeepAliveScheduler
+
+TO_REDACT = {
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "said",
+    "serial_number",
+    "title",
+    "unique_id",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    scheduler: KeepAliveScheduler = entry_data[CONF_SCHEDULER]
+    devices: dict[str, WhirlpoolOvenDevice] = entry_data[CONF_OVEN]
+
+    return async_redact_data(
+        {
+            "entry": config_entry.as_dict(),
+            "keep_alive": {
+                "fetches": scheduler.fetches,
+                "skipped": scheduler.skipped,
+                "fetch_rate": scheduler.fetch_rate,
+            },
+            "rate_limiter": async_get_rate_limiter(hass).as_dict(),
+            "ovens": [
+                {
+                    "said": device.appliance_data.said,
+                    "name": device.appliance_data.name,
+                    "model_number": device.appliance_data.model_number,
+                    "serial_number": device.appliance_data.serial_number,
+                    "cavities": None
+                    if device.cavities is None
+                    else [cavity.name for cavity in device.cavities],
+                    "connection": device.supervisor.state,
+                    "reconnects": device.supervisor.reconnects,
+                    "metrics": device.metrics.as_dict(),
+                }
+                for device in devices.values()
+            ],
+        },
+        TO_REDACT,
+    )
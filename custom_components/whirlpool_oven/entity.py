@@ -2,13 +2,75 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from whirlpool.oven import Cavity
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import CONF_OVEN, DOMAIN, SIGNAL_DEVICE_ADDED
 from .device import WhirlpoolOvenDevice, get_brand_from_model
 
 
+@dataclass(frozen=True, kw_only=True)
+class WhirlpoolCavityEntityDescription(EntityDescription):
+    """Describes a Whirlpool oven cavity entity."""
+
+    device_attribute: str
+    value_fn: Callable[[WhirlpoolOvenDevice, Cavity], Any]
+
+
+@callback
+def async_setup_cavity_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    create_entities: Callable[[WhirlpoolOvenDevice, Cavity], Iterable[Entity]],
+    create_device_entities: Callable[[WhirlpoolOvenDevice], Iterable[Entity]]
+    | None = None,
+) -> None:
+    """Add the entities of every oven, including ovens discovered later on."""
+
+    @callback
+    def async_add_oven_entities(oven_device: WhirlpoolOvenDevice) -> None:
+        """Add the entities for the cavities of an oven."""
+        async_add_entities(
+            entity
+            for cavity in oven_device.cavities
+            for entity in create_entities(oven_device, cavity)
+        )
+
+    @callback
+    def async_add_oven(oven_device: WhirlpoolOvenDevice) -> None:
+        """Add the entities for an oven, once its cavities are known."""
+        if create_device_entities is not None:
+            async_add_entities(create_device_entities(oven_device))
+        if oven_device.cavities is not None:
+            async_add_oven_entities(oven_device)
+        else:
+            # Cavities are only known once the oven has connected
+            config_entry.async_on_unload(
+                async_dispatcher_connect(
+                    hass, oven_device.signal_connected, async_add_oven_entities
+                )
+            )
+
+    for oven_device in hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN].values():
+        async_add_oven(oven_device)
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_DEVICE_ADDED.format(config_entry.entry_id), async_add_oven
+        )
+    )
+
+
 class WhirlpoolEntity(Entity):
     """A base class for Whirlpool Appliances entities."""
 
@@ -16,10 +78,13 @@ class WhirlpoolEntity(Entity):
     _attr_should_poll = False
     _attr_force_update = False
 
-    def __init__(self, device: list[WhirlpoolOvenDevice], **kwargs) -> None:
+    cavity: Cavity | None = None
+    device_attributes: tuple[str, ...] = ()
+
+    def __init__(self, device: WhirlpoolOvenDevice, **kwargs) -> None:
         """Initialize the Whirlpool entity."""
 
-        self.device: list[WhirlpoolOvenDevice] = device
+        self.device: WhirlpoolOvenDevice = device
 
         self._attr_unique_id = f"{self.device.appliance_data.said}-{self.name}"
 
@@ -39,13 +104,52 @@ class WhirlpoolEntity(Entity):
 
     async def async_added_to_hass(self) -> None:
         """Register for device state updates."""
-        self.device.register_callback(self.async_write_ha_state)
+        self.device.register_callback(
+            self._handle_device_update, self.cavity, self.device_attributes
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Unegister from device state updates."""
-        self.device.unregister_callback(self.async_write_ha_state)
+        self.device.unregister_callback(
+            self._handle_device_update, self.cavity, self.device_attributes
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine, counting the write."""
+        self.device.metrics.state_writes += 1
+        super().async_write_ha_state()
+
+    @callback
+    def _handle_device_update(self) -> None:
+        """Handle a change to the device values of this entity."""
+        self.async_write_ha_state()
 
     @property
     def available(self) -> bool:
         """Return True if device is available."""
         return self.device.is_online
+
+
+class WhirlpoolCavityEntity(WhirlpoolEntity):
+    """A base class for entities of an oven cavity."""
+
+    entity_description: WhirlpoolCavityEntityDescription
+
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        cavity: Cavity,
+        description: WhirlpoolCavityEntityDescription,
+    ) -> None:
+        """Initialize the cavity entity."""
+        self.cavity = cavity
+        self.entity_description = description
+        self.device_attributes = (description.device_attribute,)
+        self._attr_name = f"{device.get_cavity_name(cavity)} {description.name}"
+        super().__init__(device)
+
+    @property
+    def value(self) -> Any:
+        """Return the device value of this entity."""
+        return self.entity_description.value_fn(self.device, self.cavity)
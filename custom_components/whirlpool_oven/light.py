@@ -2,18 +2,42 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from whirlpool.oven import Cavity
 
-from homeassistant.components.light import ColorMode, LightEntity
+from homeassistant.components.light import (
+    ColorMode,
+    LightEntity,
+    LightEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import CONF_OVEN, DOMAIN
+from .const import ATTR_LIGHT_ON
 from .device import WhirlpoolOvenDevice
-from .entity import WhirlpoolEntity
+from .entity import (
+    WhirlpoolCavityEntity,
+    WhirlpoolCavityEntityDescription,
+    async_setup_cavity_entities,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WhirlpoolLightEntityDescription(
+    WhirlpoolCavityEntityDescription, LightEntityDescription
+):
+    """Describes a Whirlpool oven cavity light."""
+
+
+CAVITY_LIGHT = WhirlpoolLightEntityDescription(
+    key="light",
+    name="light",
+    device_attribute=ATTR_LIGHT_ON,
+    value_fn=lambda device, cavity: device.is_light_on(cavity),
+)
 
 
 async def async_setup_entry(
@@ -22,44 +46,31 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Whirlpool Appliances lights from config entry."""
+    async_setup_cavity_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        lambda oven_device, cavity: (WhirpoolOvenCavityLight(oven_device, cavity),),
+    )
 
-    for oven_device in hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN].values():
-        oven_device: WhirlpoolOvenDevice
-        oven_entities = []
-        cavities = []
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Upper):
-            cavities.append(Cavity.Upper)
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Lower):
-            cavities.append(Cavity.Lower)
-
-        for cavity in cavities:
-            oven_entities.extend(
-                [
-                    WhirpoolOvenCavityLight(oven_device, cavity),
-                ]
-            )
-        async_add_entities(oven_entities)
-
-
-class WhirpoolOvenCavityLight(WhirlpoolEntity, LightEntity):
+
+class WhirpoolOvenCavityLight(WhirlpoolCavityEntity, LightEntity):
     """Representation of an oven cavity light."""
 
     _attr_color_mode = ColorMode.ONOFF
 
     def __init__(self, device: WhirlpoolOvenDevice, cavity: Cavity) -> None:
-        """Initialize the cavity door binary sensor."""
-        self.cavity = cavity
-        super().__init__(device)
-
-    @property
-    def name(self) -> str:
-        """Return name of the light."""
-        return f"{self.device.get_cavity_name(self.cavity)} light"
+        """Initialize the cavity light."""
+        super().__init__(device, cavity, CAVITY_LIGHT)
+        self._light_queue = device.light_queue(cavity)
 
     @property
     def is_on(self):
         """Return true if the cavity light in on."""
-        return self.device.is_light_on(self.cavity)
+        optimistic = self._light_queue.optimistic
+        if optimistic is not None:
+            return optimistic
+        return self.value
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
@@ -0,0 +1,90 @@
+"""Runtime metrics for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds of the burst size histogram buckets, in updates
+BURST_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+
+class Histogram:
+    """Values, such as latencies, counted in fixed buckets."""
+
+    __slots__ = ("bounds", "count", "counts", "max", "total")
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean value."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self.bounds, self.counts)
+                },
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+class DeviceMetrics:
+    """Counters and latencies of an oven device."""
+
+    __slots__ = (
+        "burst_size",
+        "command_latency",
+        "confirmation_latency",
+        "keep_alive_latency",
+        "notifications",
+        "push_events",
+        "state_writes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.push_events = 0
+        self.notifications = 0
+        self.state_writes = 0
+        self.burst_size = Histogram(BURST_BUCKETS)
+        self.keep_alive_latency = Histogram()
+        self.command_latency = Histogram()
+        self.confirmation_latency = Histogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return {
+            "push_events": self.push_events,
+            "notifications": self.notifications,
+            "state_writes": self.state_writes,
+            "burst_size": self.burst_size.as_dict(),
+            "keep_alive_latency": self.keep_alive_latency.as_dict(),
+            "command_latency": self.command_latency.as_dict(),
+            "confirmation_latency": self.confirmation_latency.as_dict(),
+        }
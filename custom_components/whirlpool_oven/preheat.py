@@ -0,0 +1,86 @@
+"""Preheat estimation for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from .const import PREHEAT_MIN_SAMPLES, PREHEAT_SAMPLES
+
+
+class PreheatEstimator:
+    """Estimate the time to reach a temperature from a ring buffer of samples.
+
+    A line is fitted by least squares over the samples, with running sums kept so
+    adding a sample and estimating take constant time.
+    """
+
+    __slots__ = (
+        "_count",
+        "_index",
+        "_start",
+        "_sum_t",
+        "_sum_tt",
+        "_sum_ty",
+        "_sum_y",
+        "_temperatures",
+        "_times",
+        "size",
+    )
+
+    def __init__(self, size: int = PREHEAT_SAMPLES) -> None:
+        """Initialize an empty estimator."""
+        self.size = size
+        self._times = [0.0] * size
+        self._temperatures = [0.0] * size
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._index = 0
+        self._count = 0
+        self._start: float | None = None
+        self._sum_t = 0.0
+        self._sum_y = 0.0
+        self._sum_tt = 0.0
+        self._sum_ty = 0.0
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples in the buffer."""
+        return self._count
+
+    def add(self, timestamp: float, temperature: float) -> None:
+        """Add a temperature sample, replacing the oldest one when full."""
+        if self._start is None:
+            self._start = timestamp
+        # Times are relative to the first sample to keep the sums small
+        t = timestamp - self._start
+        if self._count == self.size:
+            old_t = self._times[self._index]
+            old_y = self._temperatures[self._index]
+            self._sum_t -= old_t
+            self._sum_y -= old_y
+            self._sum_tt -= old_t * old_t
+            self._sum_ty -= old_t * old_y
+        else:
+            self._count += 1
+        self._times[self._index] = t
+        self._temperatures[self._index] = temperature
+        self._index = (self._index + 1) % self.size
+        self._sum_t += t
+        self._sum_y += temperature
+        self._sum_tt += t * t
+        self._sum_ty += t * temperature
+
+    def time_to_target(self, target: float, timestamp: float) -> float | None:
+        """Return the seconds from a time until the target is reached, if rising."""
+        if self._count < PREHEAT_MIN_SAMPLES or self._start is None:
+            return None
+        n = self._count
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 0:
+            return None
+        slope = (n * self._sum_ty - self._sum_t * self._sum_y) / denominator
+        if slope <= 0:
+            return None
+        intercept = (self._sum_y - slope * self._sum_t) / n
+        reached = (target - intercept) / slope
+        return max(0.0, reached - (timestamp - self._start))
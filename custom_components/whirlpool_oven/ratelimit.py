@@ -0,0 +1,221 @@
+"""Cloud call rate limiting for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from enum import IntEnum
+import heapq
+from itertools import count
+import time
+from typing import Any, TypeVar
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURES,
+    CLOUD_CALL_BURST,
+    CLOUD_CALL_RATE,
+    DATA_RATE_LIMITER,
+    DOMAIN,
+    LOGGER,
+)
+from .metrics import Histogram
+
+_T = TypeVar("_T")
+
+
+class CircuitOpenError(ClientError):
+    """Error raised for a cloud call while the circuit breaker is open."""
+
+
+class CallPriority(IntEnum):
+    """Priority of a cloud call, lower values go first."""
+
+    COMMAND = 0
+    RESYNC = 1
+    KEEP_ALIVE = 2
+
+
+class CloudRateLimiter:
+    """Token bucket shared by the Whirlpool cloud calls, with a circuit breaker."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = CLOUD_CALL_RATE,
+        burst: int = CLOUD_CALL_BURST,
+    ) -> None:
+        """Initialize the limiter with a full bucket."""
+        self.hass = hass
+        self.rate = rate
+        self.burst = burst
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self.max_queue_depth = 0
+        self.wait_time = Histogram()
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._queue: list[tuple[int, int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._drain_task: asyncio.Task | None = None
+        self._opened_at: float | None = None
+        # The call allowed through after the cooldown, which decides the breaker
+        self._trial: object | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of calls waiting for a token."""
+        return len(self._queue)
+
+    @property
+    def breaker_open(self) -> bool:
+        """Return True while calls are rejected after repeated failures."""
+        return (
+            self._opened_at is not None
+            and time.monotonic() - self._opened_at < BREAKER_COOLDOWN
+        )
+
+    async def async_call(
+        self,
+        priority: CallPriority,
+        call: Callable[[], Awaitable[_T]],
+        *,
+        cost: int = 1,
+        success: Callable[[_T], bool] | None = None,
+    ) -> _T:
+        """Make a cloud call once enough tokens are available for its priority.
+
+        The cost is the number of HTTP requests the call makes. A call fails when it
+        raises a client error or a timeout, or when success returns False for its
+        result; the library reports many failed requests with False or not at all.
+        """
+        ticket = object()
+        if self._async_reject(ticket):
+            self.rejected += 1
+            raise CircuitOpenError("Too many failed Whirlpool calls, waiting to retry")
+
+        start = time.monotonic()
+        try:
+            await self._async_acquire(priority, min(cost, self.burst))
+            self.wait_time.record(time.monotonic() - start)
+            self.calls += 1
+            result = await call()
+        except (ClientError, TimeoutError):
+            self._async_record(False, ticket)
+            raise
+        except BaseException:
+            # A call that did not complete does not decide its trial after the cooldown
+            if self._trial is ticket:
+                self._trial = None
+            raise
+        self._async_record(success is None or success(result), ticket)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limiter statistics as a dict."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "calls": self.calls,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "breaker_open": self.breaker_open,
+            "wait_time": self.wait_time.as_dict(),
+        }
+
+    @callback
+    def _async_reject(self, ticket: object) -> bool:
+        """Return True if the circuit breaker rejects a call."""
+        if self._opened_at is None:
+            return False
+        if self.breaker_open:
+            return True
+        # After the cooldown a single trial call decides whether to close the breaker
+        if self._trial is not None:
+            return True
+        self._trial = ticket
+        return False
+
+    @callback
+    def _async_record(self, success: bool, ticket: object) -> None:
+        """Count the result of a call, opening or closing the circuit breaker."""
+        if success:
+            if self._opened_at is not None:
+                LOGGER.info(
+                    "Whirlpool calls succeed again, closing the circuit breaker"
+                )
+            self.failures = 0
+            self._opened_at = None
+            self._trial = None
+            return
+
+        self.failures += 1
+        trial = self._trial is ticket
+        if trial or self.failures == BREAKER_FAILURES:
+            LOGGER.warning(
+                f"{self.failures} Whirlpool calls failed in a row, pausing calls for "
+                f"{BREAKER_COOLDOWN}s"
+            )
+        if trial or self.failures >= BREAKER_FAILURES:
+            # A new cooldown starts, after which a new trial decides the breaker
+            self._opened_at = time.monotonic()
+            self._trial = None
+
+    @callback
+    def _async_refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+
+    async def _async_acquire(self, priority: CallPriority, cost: int) -> None:
+        """Take tokens, waiting behind calls of the same or a higher priority."""
+        self._async_refill()
+        if not self._queue and self._tokens >= cost:
+            self._tokens -= cost
+            return
+
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), cost, future))
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        if self._drain_task is None:
+            self._drain_task = self.hass.async_create_background_task(
+                self._async_drain(), f"{DOMAIN}-rate-limiter"
+            )
+        await future
+
+    async def _async_drain(self) -> None:
+        """Hand out tokens to the waiting calls as they are earned."""
+        try:
+            while self._queue:
+                self._async_refill()
+                _, _, cost, future = self._queue[0]
+                # Skip calls that were cancelled while waiting
+                if future.done():
+                    heapq.heappop(self._queue)
+                    continue
+                if self._tokens < cost:
+                    await asyncio.sleep((cost - self._tokens) / self.rate)
+                    continue
+                heapq.heappop(self._queue)
+                self._tokens -= cost
+                future.set_result(None)
+        finally:
+            self._drain_task = None
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant) -> CloudRateLimiter:
+    """Return the rate limiter shared by all config entries."""
+    if DATA_RATE_LIMITER not in hass.data:
+        hass.data[DATA_RATE_LIMITER] = CloudRateLimiter(hass)
+    return hass.data[DATA_RATE_LIMITER]
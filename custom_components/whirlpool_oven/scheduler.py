@@ -0,0 +1,119 @@
+"""Keep-alive scheduling for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from functools import partial
+import random
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .const import KEEP_ALIVE_INTERVAL, LOGGER
+from .supervisor import ConnectionState
+
+if TYPE_CHECKING:
+    from .device import WhirlpoolOvenDevice
+
+
+class KeepAliveScheduler:
+    """Keep the API connections of the ovens in a config entry from going stale."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        devices: dict[str, WhirlpoolOvenDevice],
+        interval: timedelta = KEEP_ALIVE_INTERVAL,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self.devices = devices
+        self.interval = interval
+        self.fetches = 0
+        self.skipped = 0
+        self._started = time.monotonic()
+        self._unsub_interval: CALLBACK_TYPE | None = None
+        self._pending: dict[str, CALLBACK_TYPE] = {}
+
+    @property
+    def fetch_rate(self) -> float:
+        """Return the number of keep-alive fetches per hour."""
+        hours = (time.monotonic() - self._started) / 3600
+        return self.fetches / hours if hours else 0.0
+
+    @callback
+    def async_start(self) -> None:
+        """Start scheduling keep-alive calls."""
+        self._started = time.monotonic()
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_schedule, self.interval
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop scheduling keep-alive calls."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        for cancel in self._pending.values():
+            cancel()
+        self._pending.clear()
+
+    @callback
+    def async_cancel(self, said: str) -> None:
+        """Cancel the pending keep-alive call of an oven."""
+        if (cancel := self._pending.pop(said, None)) is not None:
+            cancel()
+
+    @callback
+    def _async_schedule(self, now: datetime) -> None:
+        """Spread keep-alive calls for live ovens without recent push traffic."""
+        self._async_check_push_channels()
+        interval = self.interval.total_seconds()
+        cutoff = time.monotonic() - interval
+        due = [
+            device
+            for said, device in self.devices.items()
+            # A keep-alive fetch updates the oven as well, so only pushes count
+            if device.last_push < cutoff
+            and said not in self._pending
+            and device.supervisor.state == ConnectionState.LIVE
+        ]
+        self.skipped += len(self.devices) - len(due)
+
+        slot = interval / len(due) if due else 0
+        for index, device in enumerate(due):
+            said = device.appliance_data.said
+            self._pending[said] = async_call_later(
+                self.hass,
+                index * slot + random.uniform(0, slot),
+                partial(self._async_keep_alive, device),
+            )
+        LOGGER.debug(
+            f"Scheduled keep-alive for {len(due)} of {len(self.devices)} ovens "
+            f"({self.fetch_rate:.1f} fetches per hour)"
+        )
+
+    @callback
+    def _async_check_push_channels(self) -> None:
+        """Reconnect the live ovens whose push channel was dropped."""
+        # The push channel only carries attribute changes, so silence says nothing
+        for device in self.devices.values():
+            if (
+                device.supervisor.state == ConnectionState.LIVE
+                and device.push_channel_dropped()
+            ):
+                LOGGER.debug(
+                    f"The push channel of {device.appliance_data.name} was dropped"
+                )
+                device.supervisor.async_mark_stale()
+
+    async def _async_keep_alive(
+        self, device: WhirlpoolOvenDevice, now: datetime
+    ) -> None:
+        """Keep the API connection of an oven alive."""
+        self._pending.pop(device.appliance_data.said, None)
+        self.fetches += 1
+        await device.keep_alive()
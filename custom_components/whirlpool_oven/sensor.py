@@ -2,22 +2,224 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import time
+from typing import Any
+
 from whirlpool.oven import Cavity
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import StateType
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_OVEN, DOMAIN, OVEN_CAVITY_STATES, OVEN_COOK_MODES
+from .const import (
+    ATTR_CAVITY_STATE,
+    ATTR_COOK_MODE,
+    ATTR_COOK_SESSIONS,
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TARGET_TEMPERATURE,
+    CONF_TEMPERATURE_DELTA,
+    CONF_TEMPERATURE_INTERVAL,
+    DEFAULT_TEMPERATURE_DELTA,
+    DEFAULT_TEMPERATURE_INTERVAL,
+    OVEN_CAVITY_STATES,
+    OVEN_COOK_MODES,
+    TEMPERATURE_SETTLE_TIME,
+)
 from .device import WhirlpoolOvenDevice
-from .entity import WhirlpoolEntity
+from .entity import (
+    WhirlpoolCavityEntity,
+    WhirlpoolCavityEntityDescription,
+    WhirlpoolEntity,
+    async_setup_cavity_entities,
+)
+from .preheat import PreheatEstimator
+
+# Only followed while the cavity is preheating
+PREHEAT_ATTRIBUTES = (ATTR_CURRENT_TEMPERATURE, ATTR_TARGET_TEMPERATURE)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WhirlpoolMetricSensorEntityDescription(SensorEntityDescription):
+    """Describes a Whirlpool oven metric sensor."""
+
+    value_fn: Callable[[WhirlpoolOvenDevice], StateType]
+
+
+@dataclass(frozen=True, kw_only=True)
+class WhirlpoolCavitySensorEntityDescription(
+    WhirlpoolCavityEntityDescription, SensorEntityDescription
+):
+    """Describes a Whirlpool oven cavity sensor."""
+
+
+METRIC_SENSORS: tuple[WhirlpoolMetricSensorEntityDescription, ...] = (
+    WhirlpoolMetricSensorEntityDescription(
+        key="push_events",
+        name="Push events",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.push_events,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="notifications",
+        name="Entity notifications",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.notifications,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="state_writes",
+        name="State writes",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.metrics.state_writes,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="burst_size",
+        name="Mean update burst size",
+        suggested_display_precision=1,
+        value_fn=lambda device: device.metrics.burst_size.mean,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda device: device.supervisor.reconnects,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="keep_alive_latency",
+        name="Keep-alive latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda device: device.metrics.keep_alive_latency.mean,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="command_latency",
+        name="Command latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda device: device.metrics.command_latency.mean,
+    ),
+    WhirlpoolMetricSensorEntityDescription(
+        key="confirmation_latency",
+        name="Light confirmation latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        value_fn=lambda device: device.metrics.confirmation_latency.mean,
+    ),
+)
+
+
+CAVITY_SENSORS: tuple[WhirlpoolCavitySensorEntityDescription, ...] = (
+    WhirlpoolCavitySensorEntityDescription(
+        key="state",
+        name="state",
+        icon="mdi:stove",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(OVEN_CAVITY_STATES.values()),
+        device_attribute=ATTR_CAVITY_STATE,
+        value_fn=lambda device, cavity: device.cavity_state(cavity),
+    ),
+    WhirlpoolCavitySensorEntityDescription(
+        key="cook_mode",
+        name="cook mode",
+        icon="mdi:stove",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(OVEN_COOK_MODES.values()),
+        device_attribute=ATTR_COOK_MODE,
+        value_fn=lambda device, cavity: device.cook_mode(cavity),
+    ),
+)
+
+TEMPERATURE_SENSORS: tuple[WhirlpoolCavitySensorEntityDescription, ...] = (
+    WhirlpoolCavitySensorEntityDescription(
+        key="current_temperature",
+        name="current temperature",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_attribute=ATTR_CURRENT_TEMPERATURE,
+        value_fn=lambda device, cavity: device.current_temperature(cavity),
+    ),
+    WhirlpoolCavitySensorEntityDescription(
+        key="target_temperature",
+        name="target temperature",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        device_attribute=ATTR_TARGET_TEMPERATURE,
+        value_fn=lambda device, cavity: device.target_temperature(cavity),
+    ),
+)
+
+COOK_SESSION_SENSORS: tuple[WhirlpoolCavitySensorEntityDescription, ...] = (
+    WhirlpoolCavitySensorEntityDescription(
+        key="cook_sessions_today",
+        name="cook sessions today",
+        icon="mdi:counter",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        device_attribute=ATTR_COOK_SESSIONS,
+        value_fn=lambda device, cavity: device.cook_sessions[cavity].sessions_today,
+    ),
+    WhirlpoolCavitySensorEntityDescription(
+        key="total_cooking_time",
+        name="total cooking time",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.HOURS,
+        device_attribute=ATTR_COOK_SESSIONS,
+        value_fn=lambda device, cavity: round(device.cook_sessions[cavity].total_time),
+    ),
+    WhirlpoolCavitySensorEntityDescription(
+        key="last_cook_session",
+        name="last cook session",
+        icon="mdi:timer-sand-complete",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        device_attribute=ATTR_COOK_SESSIONS,
+        value_fn=lambda device, cavity: (
+            None
+            if (duration := device.cook_sessions[cavity].last_duration) is None
+            else round(duration)
+        ),
+    ),
+    WhirlpoolCavitySensorEntityDescription(
+        key="last_cook_mode",
+        name="last cook mode",
+        icon="mdi:stove",
+        device_class=SensorDeviceClass.ENUM,
+        options=list(OVEN_COOK_MODES.values()),
+        device_attribute=ATTR_COOK_SESSIONS,
+        value_fn=lambda device, cavity: device.cook_sessions[cavity].last_mode,
+    ),
+)
+
+PREHEAT_SENSOR = WhirlpoolCavitySensorEntityDescription(
+    key="preheat_eta",
+    name="preheat ETA",
+    icon="mdi:timer-outline",
+    device_class=SensorDeviceClass.TIMESTAMP,
+    device_attribute=ATTR_CAVITY_STATE,
+    value_fn=lambda device, cavity: device.cavity_state(cavity),
+)
 
 
 async def async_setup_entry(
@@ -26,97 +228,270 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Whirlpool Appliances sensors from config entry."""
+    min_delta = config_entry.options.get(
+        CONF_TEMPERATURE_DELTA, DEFAULT_TEMPERATURE_DELTA
+    )
+    min_interval = config_entry.options.get(
+        CONF_TEMPERATURE_INTERVAL, DEFAULT_TEMPERATURE_INTERVAL
+    )
 
-    for oven_device in hass.data[DOMAIN][config_entry.entry_id][CONF_OVEN].values():
-        oven_device: WhirlpoolOvenDevice
-        oven_entities = []
-        cavities = []
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Upper):
-            cavities.append(Cavity.Upper)
-        if oven_device.oven.get_oven_cavity_exists(Cavity.Lower):
-            cavities.append(Cavity.Lower)
-
-        for cavity in cavities:
-            oven_entities.extend(
-                [
-                    WhirpoolOvenCavityStateSensor(oven_device, cavity),
-                    WhirpoolOvenCookModeSensor(oven_device, cavity),
-                    WhirpoolOvenTemperatureSensor(oven_device, cavity, "current"),
-                    WhirpoolOvenTemperatureSensor(oven_device, cavity, "target"),
-                ]
-            )
-        async_add_entities(oven_entities)
+    def create_device_entities(oven_device: WhirlpoolOvenDevice) -> list[SensorEntity]:
+        """Create the sensors of an oven."""
+        return [
+            WhirpoolOvenMetricSensor(oven_device, description)
+            for description in METRIC_SENSORS
+        ]
 
+    def create_entities(
+        oven_device: WhirlpoolOvenDevice, cavity: Cavity
+    ) -> list[SensorEntity]:
+        """Create the sensors of an oven cavity."""
+        return [
+            *(
+                WhirpoolOvenCavitySensor(oven_device, cavity, description)
+                for description in CAVITY_SENSORS
+            ),
+            *(
+                WhirpoolOvenTemperatureSensor(
+                    oven_device, cavity, description, min_delta, min_interval
+                )
+                for description in TEMPERATURE_SENSORS
+            ),
+            WhirpoolOvenPreheatSensor(oven_device, cavity, PREHEAT_SENSOR),
+            *(
+                WhirpoolOvenCavitySensor(oven_device, cavity, description)
+                for description in COOK_SESSION_SENSORS
+            ),
+        ]
 
-class WhirpoolOvenCavityStateSensor(WhirlpoolEntity, SensorEntity):
-    """State of an oven cavity."""
+    async_setup_cavity_entities(
+        hass,
+        config_entry,
+        async_add_entities,
+        create_entities,
+        create_device_entities,
+    )
 
-    _attr_icon = "mdi:stove"
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = list(OVEN_CAVITY_STATES.values())
 
-    def __init__(self, device, cavity: Cavity) -> None:
-        """Initialize the cavity state sensor."""
-        self.cavity = cavity
-        super().__init__(device)
+class WhirpoolOvenCavitySensor(WhirlpoolCavityEntity, SensorEntity):
+    """Sensor of an oven cavity."""
+
+    entity_description: WhirlpoolCavitySensorEntityDescription
+
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        cavity: Cavity,
+        description: WhirlpoolCavitySensorEntityDescription,
+    ) -> None:
+        """Initialize the cavity sensor."""
+        super().__init__(device, cavity, description)
 
     @property
-    def name(self) -> str:
-        """Return name of the sensor."""
-        return f"{self.device.get_cavity_name(self.cavity)} state"
+    def native_value(self) -> StateType | str:
+        """Return native value of sensor."""
+        return self.value
+
+
+class WhirpoolOvenTemperatureSensor(WhirlpoolCavityEntity, SensorEntity):
+    """Temperature of an oven cavity, published through a deadband and rate limit."""
+
+    entity_description: WhirlpoolCavitySensorEntityDescription
+
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        cavity: Cavity,
+        description: WhirlpoolCavitySensorEntityDescription,
+        min_delta: float,
+        min_interval: float,
+    ) -> None:
+        """Initialize the temperature sensor."""
+        self.min_delta = min_delta
+        self.min_interval = min_interval
+        self.suppressed_updates = 0
+        self._published_value: float | None = None
+        self._published_at = 0.0
+        self._cancel_settle: CALLBACK_TYPE | None = None
+        super().__init__(device, cavity, description)
 
     @property
     def native_value(self) -> StateType | str:
         """Return native value of sensor."""
-        return self.device.cavity_state(self.cavity)
+        return self._published_value
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the number of updates held back by the filter."""
+        return {"suppressed_updates": self.suppressed_updates}
 
-class WhirpoolOvenCookModeSensor(WhirlpoolEntity, SensorEntity):
-    """Cook mode of an oven cavity."""
+    async def async_added_to_hass(self) -> None:
+        """Publish the initial temperature and register for updates."""
+        if self.device.connected:
+            self._published_value = self.value
+            self._published_at = time.monotonic()
+        await super().async_added_to_hass()
 
-    _attr_icon = "mdi:stove"
-    _attr_device_class = SensorDeviceClass.ENUM
-    _attr_options = list(OVEN_COOK_MODES.values())
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending publish and unregister from updates."""
+        self._async_cancel_settle()
+        await super().async_will_remove_from_hass()
 
-    def __init__(self, device, cavity: Cavity) -> None:
-        """Initialize the cook mode sensor."""
-        self.cavity = cavity
-        super().__init__(device)
+    @callback
+    def _handle_device_update(self) -> None:
+        """Publish the temperature if it moved enough, else once it settles."""
+        value = self.value
+        now = time.monotonic()
+        self._async_cancel_settle()
+        if (
+            value is None
+            or self._published_value is None
+            or value == self._published_value
+            or (
+                abs(value - self._published_value) >= self.min_delta
+                and now - self._published_at >= self.min_interval
+            )
+        ):
+            self._async_publish(value, now)
+            return
+
+        self.suppressed_updates += 1
+        self._cancel_settle = async_call_later(
+            self.hass,
+            max(self.min_interval, TEMPERATURE_SETTLE_TIME),
+            self._async_publish_settled,
+        )
+
+    @callback
+    def _async_publish(self, value: float | None, now: float) -> None:
+        """Write a new temperature to the state machine."""
+        self._published_value = value
+        self._published_at = now
+        self.async_write_ha_state()
+
+    @callback
+    def _async_publish_settled(self, _now: Any) -> None:
+        """Publish the last temperature once no more updates arrived."""
+        self._cancel_settle = None
+        self._async_publish(self.value, time.monotonic())
+
+    @callback
+    def _async_cancel_settle(self) -> None:
+        """Cancel a pending publish of a settled temperature."""
+        if self._cancel_settle is not None:
+            self._cancel_settle()
+            self._cancel_settle = None
+
+
+class WhirpoolOvenPreheatSensor(WhirlpoolCavityEntity, SensorEntity):
+    """Estimated time an oven cavity reaches its target temperature."""
+
+    entity_description: WhirlpoolCavitySensorEntityDescription
+
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        cavity: Cavity,
+        description: WhirlpoolCavitySensorEntityDescription,
+    ) -> None:
+        """Initialize the preheat sensor."""
+        self._estimator = PreheatEstimator()
+        self._preheating = False
+        self._last_temperature: float | None = None
+        self._eta: datetime | None = None
+        self._time_to_target: int | None = None
+        super().__init__(device, cavity, description)
 
     @property
-    def name(self) -> str:
-        """Return name of the sensor."""
-        return f"{self.device.get_cavity_name(self.cavity)} cook mode"
+    def native_value(self) -> datetime | None:
+        """Return the estimated time the target temperature is reached."""
+        return self._eta
 
     @property
-    def native_value(self) -> StateType | str:
-        """Return native value of sensor."""
-        return self.device.cook_mode(self.cavity)
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the seconds left until the target temperature is reached."""
+        return {"time_to_target": self._time_to_target}
 
+    async def async_added_to_hass(self) -> None:
+        """Register for updates, following the temperatures if preheating."""
+        await super().async_added_to_hass()
+        if self.value == OVEN_CAVITY_STATES["Preheating"]:
+            self._async_set_preheating(True)
 
-class WhirpoolOvenTemperatureSensor(WhirlpoolEntity, SensorEntity):
-    """Temperature of an oven cavity."""
+    @callback
+    def _handle_device_update(self) -> None:
+        """Add a temperature sample and update the estimate while preheating."""
+        preheating = self.value == OVEN_CAVITY_STATES["Preheating"]
+        if preheating != self._preheating:
+            self._async_set_preheating(preheating)
+        elif not preheating:
+            return
 
-    _attr_icon = "mdi:thermometer"
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
+        time_to_target = None
+        if preheating:
+            now = time.monotonic()
+            temperature = self.device.current_temperature(self.cavity)
+            if temperature is not None and temperature != self._last_temperature:
+                self._last_temperature = temperature
+                self._estimator.add(now, temperature)
+            target = self.device.target_temperature(self.cavity)
+            if target is not None:
+                time_to_target = self._estimator.time_to_target(target, now)
 
-    def __init__(self, device, cavity: Cavity, temperature_type: str) -> None:
-        """Initialize the cook mode sensor."""
-        self.cavity = cavity
-        self.temperature_type = temperature_type
+        if time_to_target is None:
+            self._time_to_target = None
+            self._eta = None
+        else:
+            self._time_to_target = round(time_to_target)
+            self._eta = dt_util.utcnow().replace(microsecond=0) + timedelta(
+                seconds=self._time_to_target
+            )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_set_preheating(self, preheating: bool) -> None:
+        """Start or stop following the temperatures of the cavity."""
+        self._preheating = preheating
+        self._estimator.reset()
+        self._last_temperature = None
+        if preheating:
+            self.device.register_callback(
+                self._handle_device_update, self.cavity, PREHEAT_ATTRIBUTES
+            )
+            self.device_attributes = (ATTR_CAVITY_STATE, *PREHEAT_ATTRIBUTES)
+        else:
+            self.device.unregister_callback(
+                self._handle_device_update, self.cavity, PREHEAT_ATTRIBUTES
+            )
+            self.device_attributes = (ATTR_CAVITY_STATE,)
+
+
+class WhirpoolOvenMetricSensor(WhirlpoolEntity, SensorEntity):
+    """Runtime metric of an oven device."""
+
+    entity_description: WhirlpoolMetricSensorEntityDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Polled, so metrics do not cause state writes of their own on every update
+    _attr_should_poll = True
+
+    def __init__(
+        self,
+        device: WhirlpoolOvenDevice,
+        description: WhirlpoolMetricSensorEntityDescription,
+    ) -> None:
+        """Initialize the metric sensor."""
+        self.entity_description = description
+        self._attr_name = description.name
         super().__init__(device)
 
     @property
-    def name(self) -> str:
-        """Return name of the sensor."""
-        return f"{self.device.get_cavity_name(self.cavity)} {self.temperature_type} temperature"
+    def available(self) -> bool:
+        """Return True, metrics are available while the oven is offline."""
+        return True
 
     @property
-    def native_value(self) -> StateType | str:
+    def native_value(self) -> StateType:
         """Return native value of sensor."""
-        if self.temperature_type == "current":
-            return self.device.current_temperature(self.cavity)
-        if self.temperature_type == "target":
-            return self.device.target_temperature(self.cavity)
+        return self.entity_description.value_fn(self.device)
@@ -0,0 +1,210 @@
+"""Services for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .const import BULK_COMMAND_CONCURRENCY, CONF_OVEN, DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from whirlpool.oven import Cavity
+
+    from .device import WhirlpoolOvenDevice
+
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+SERVICE_BULK_COMMAND = "bulk_command"
+
+ATTR_CAVITY = "cavity"
+ATTR_COMMAND = "command"
+ATTR_MAX_CONCURRENCY = "max_concurrency"
+
+COMMAND_LIGHT_ON = "light_on"
+COMMAND_LIGHT_OFF = "light_off"
+
+STATUS_SENT = "sent"
+STATUS_ALREADY_PENDING = "already_pending"
+STATUS_FAILED = "failed"
+
+BULK_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_COMMAND): vol.In([COMMAND_LIGHT_ON, COMMAND_LIGHT_OFF]),
+        vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_CAVITY): vol.All(
+            cv.ensure_list, [vol.In(["upper", "lower"])]
+        ),
+        vol.Optional(ATTR_MAX_CONCURRENCY, default=BULK_COMMAND_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=20)
+        ),
+    }
+)
+
+
+def device_snapshot(device: WhirlpoolOvenDevice) -> dict[str, Any]:
+    """Return the current values of an oven and its cavities."""
+    appliance_data = device.appliance_data
+    return {
+        "said": appliance_data.said,
+        "name": appliance_data.name,
+        "data_model": appliance_data.data_model,
+        "category": appliance_data.category,
+        "model_number": appliance_data.model_number,
+        "serial_number": appliance_data.serial_number,
+        "online": device.is_online,
+        "cavities": [
+            {
+                "cavity": cavity.name.lower(),
+                "name": device.get_cavity_name(cavity),
+                **asdict(device.snapshot(cavity)),
+            }
+            for cavity in device.cavities or ()
+        ],
+    }
+
+
+@callback
+def async_get_target_devices(
+    hass: HomeAssistant, device_ids: list[str] | None
+) -> list[WhirlpoolOvenDevice]:
+    """Return the ovens of the given devices, or every oven without devices."""
+    devices: dict[str, WhirlpoolOvenDevice] = {
+        said: device
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        for said, device in entry_data.get(CONF_OVEN, {}).items()
+    }
+    if device_ids is None:
+        return list(devices.values())
+
+    device_registry = dr.async_get(hass)
+    targets: list[WhirlpoolOvenDevice] = []
+    for device_id in device_ids:
+        saids: set[str] = set()
+        if (device_entry := device_registry.async_get(device_id)) is not None:
+            saids = {
+                said for domain, said in device_entry.identifiers if domain == DOMAIN
+            }
+        if not (said := next(iter(saids & devices.keys()), None)):
+            raise ServiceValidationError(f"Device {device_id} is not a loaded oven")
+        targets.append(devices[said])
+    return targets
+
+
+async def async_run_command(
+    device: WhirlpoolOvenDevice,
+    cavity: Cavity,
+    command: str,
+    semaphore: asyncio.Semaphore,
+) -> dict[str, Any]:
+    """Send a command to an oven cavity and return its result and latency.
+
+    A command merged into one already being sent to the cavity has no result of
+    its own, so its success is None.
+    """
+    result: dict[str, Any] = {
+        "said": device.appliance_data.said,
+        "cavity": cavity.name.lower(),
+    }
+    async with semaphore:
+        start = time.monotonic()
+        try:
+            if command == COMMAND_LIGHT_ON:
+                sent = await device.turn_on_light(cavity)
+            else:
+                sent = await device.turn_off_light(cavity)
+        except (ClientError, TimeoutError) as err:
+            result.update(
+                success=False,
+                status=STATUS_FAILED,
+                error=str(err) or type(err).__name__,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # One failing oven must not take the results of the others with it
+            LOGGER.exception(f"Unexpected error sending {command} to {result['said']}")
+            result.update(
+                success=False,
+                status=STATUS_FAILED,
+                error=str(err) or type(err).__name__,
+            )
+        else:
+            result.update(
+                success=True if sent else None,
+                status=STATUS_SENT if sent else STATUS_ALREADY_PENDING,
+            )
+        result["latency"] = time.monotonic() - start
+    return result
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    @callback
+    def async_get_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Return the values of every oven, from memory without calling the cloud."""
+        return {
+            "ovens": [
+                {"entry_id": entry_id, **device_snapshot(device)}
+                for entry_id, entry_data in hass.data.get(DOMAIN, {}).items()
+                for device in entry_data.get(CONF_OVEN, {}).values()
+            ]
+        }
+
+    async def async_bulk_command(call: ServiceCall) -> ServiceResponse:
+        """Send a command to the cavities of several ovens concurrently."""
+        devices = async_get_target_devices(hass, call.data.get(ATTR_DEVICE_ID))
+        cavities = call.data.get(ATTR_CAVITY)
+        semaphore = asyncio.Semaphore(call.data[ATTR_MAX_CONCURRENCY])
+        start = time.monotonic()
+        results: list[dict[str, Any]] = [
+            {
+                "said": device.appliance_data.said,
+                "success": False,
+                "status": STATUS_FAILED,
+                "error": "Cavities are not known until the oven connects",
+            }
+            for device in devices
+            if device.cavities is None
+        ]
+        results.extend(
+            await asyncio.gather(
+                *(
+                    async_run_command(
+                        device, cavity, call.data[ATTR_COMMAND], semaphore
+                    )
+                    for device in devices
+                    for cavity in device.cavities or ()
+                    if cavities is None or cavity.name.lower() in cavities
+                )
+            )
+        )
+        return {"results": results, "elapsed": time.monotonic() - start}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SNAPSHOT,
+        async_get_snapshot,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        async_bulk_command,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
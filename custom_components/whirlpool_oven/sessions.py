@@ -0,0 +1,207 @@
+"""Cook session statistics for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later, async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_CAVITY_STATE,
+    ATTR_COOK_MODE,
+    ATTR_COOK_SESSIONS,
+    COOK_SESSIONS_SAVE_DELAY,
+    OVEN_CAVITY_STATES,
+    OVEN_COOK_MODES,
+)
+from .storage import async_load_sessions, async_save_sessions
+
+if TYPE_CHECKING:
+    from whirlpool.oven import Cavity
+
+    from .device import WhirlpoolOvenDevice
+
+# Cavity states that are part of a cook session
+ACTIVE_STATES = (OVEN_CAVITY_STATES["Preheating"], OVEN_CAVITY_STATES["Cooking"])
+
+
+class CookSessionStats:
+    """Running totals of the cook sessions of an oven cavity."""
+
+    __slots__ = (
+        "day",
+        "last_duration",
+        "last_mode",
+        "mode",
+        "sessions_today",
+        "started_at",
+        "total_time",
+    )
+
+    def __init__(self, data: dict[str, Any] | None = None) -> None:
+        """Initialize the statistics, from saved data if there is any."""
+        data = data or {}
+        self.day: str | None = data.get("day")
+        self.sessions_today: int = data.get("sessions_today", 0)
+        self.total_time: float = data.get("total_time", 0.0)
+        self.last_duration: float | None = data.get("last_duration")
+        self.last_mode: str | None = data.get("last_mode")
+        # Start and mode of the running session, if any
+        self.started_at: float | None = data.get("started_at")
+        self.mode: str | None = data.get("mode")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict to save."""
+        return {attribute: getattr(self, attribute) for attribute in self.__slots__}
+
+    def new_day(self, now: datetime) -> bool:
+        """Reset the sessions of today on a new day, returning True if they were."""
+        day = now.date().isoformat()
+        if day == self.day:
+            return False
+        self.day = day
+        self.sessions_today = 0
+        return True
+
+    def update(self, state: str | None, mode: str | None, now: datetime) -> bool:
+        """Apply the state of the cavity, returning True if the statistics changed."""
+        changed = self.new_day(now)
+        if state in ACTIVE_STATES:
+            if mode is not None and mode != OVEN_COOK_MODES["Standby"]:
+                self.mode = mode
+            if self.started_at is None:
+                self.started_at = now.timestamp()
+                self.sessions_today += 1
+                return True
+        elif state is not None and self.started_at is not None:
+            self.last_duration = now.timestamp() - self.started_at
+            self.last_mode = self.mode
+            self.total_time += self.last_duration
+            self.started_at = None
+            self.mode = None
+            return True
+        return changed
+
+
+class CookSessionTracker:
+    """Follow the cook sessions of the ovens in a config entry and save their totals."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.entry_id = entry_id
+        self._devices: list[WhirlpoolOvenDevice] = []
+        self._saved: dict[str, dict[str, dict[str, Any]]] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._cancel_save: CALLBACK_TYPE | None = None
+
+    async def async_start(self, devices: list[WhirlpoolOvenDevice]) -> None:
+        """Restore the saved totals and follow the cavities of the ovens."""
+        self._saved = await async_load_sessions(self.hass, self.entry_id)
+        for device in devices:
+            self.async_add_device(device)
+        self._unsubs.append(
+            async_track_time_change(
+                self.hass, self._async_new_day, hour=0, minute=0, second=0
+            )
+        )
+
+    async def async_stop(self) -> None:
+        """Stop following the ovens and save the totals."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+        if self._cancel_save is not None:
+            self._cancel_save()
+            self._cancel_save = None
+        await async_save_sessions(self.hass, self.entry_id, self._as_dict())
+
+    @callback
+    def async_add_device(self, device: WhirlpoolOvenDevice) -> None:
+        """Follow the cavities of an oven, once they are known."""
+        if device.cavities is not None:
+            self._async_follow_device(device)
+        else:
+            # Cavities are only known once the oven has connected
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self.hass, device.signal_connected, self._async_follow_device
+                )
+            )
+
+    @callback
+    def async_remove_device(self, device: WhirlpoolOvenDevice) -> None:
+        """Stop following an oven removed from the account and drop its totals."""
+        if device in self._devices:
+            self._devices.remove(device)
+        self._saved.pop(device.appliance_data.said, None)
+        self._async_schedule_save()
+
+    @callback
+    def _async_follow_device(self, device: WhirlpoolOvenDevice) -> None:
+        """Follow the cavities of an oven."""
+        self._devices.append(device)
+        saved = self._saved.get(device.appliance_data.said, {})
+        for cavity in device.cavities:
+            device.cook_sessions[cavity] = CookSessionStats(
+                saved.get(str(cavity.value))
+            )
+            handle_update = partial(self._async_handle_update, device, cavity)
+            attributes = (ATTR_CAVITY_STATE, ATTR_COOK_MODE)
+            device.register_callback(handle_update, cavity, attributes)
+            self._unsubs.append(
+                partial(device.unregister_callback, handle_update, cavity, attributes)
+            )
+            handle_update()
+
+    @callback
+    def _async_handle_update(self, device: WhirlpoolOvenDevice, cavity: Cavity) -> None:
+        """Count a session when a cavity starts or stops cooking."""
+        if device.cook_sessions[cavity].update(
+            device.cavity_state(cavity), device.cook_mode(cavity), dt_util.now()
+        ):
+            device.async_notify(cavity, ATTR_COOK_SESSIONS)
+            self._async_schedule_save()
+
+    @callback
+    def _async_new_day(self, now: datetime) -> None:
+        """Reset the sessions of today at midnight."""
+        for device in self._devices:
+            for cavity, stats in device.cook_sessions.items():
+                if stats.new_day(now):
+                    device.async_notify(cavity, ATTR_COOK_SESSIONS)
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the totals soon, collecting the changes until then."""
+        if self._cancel_save is None:
+            self._cancel_save = async_call_later(
+                self.hass, COOK_SESSIONS_SAVE_DELAY, self._async_save
+            )
+
+    @callback
+    def _async_save(self, _now: Any) -> None:
+        """Save the totals in the background."""
+        self._cancel_save = None
+        self.hass.async_create_task(
+            async_save_sessions(self.hass, self.entry_id, self._as_dict())
+        )
+
+    def _as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the totals of all ovens to save."""
+        return {
+            **self._saved,
+            **{
+                device.appliance_data.said: {
+                    str(cavity.value): stats.as_dict()
+                    for cavity, stats in device.cook_sessions.items()
+                }
+                for device in self._devices
+            },
+        }
@@ -0,0 +1,91 @@
+"""Persistent storage for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from whirlpool.auth import Auth
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+
+STORAGE_VERSION = 1
+
+
+def _auth_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the token store of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.auth", private=True)
+
+
+async def async_load_auth(hass: HomeAssistant, entry_id: str, auth: Auth) -> None:
+    """Restore previously saved tokens into an Auth instance."""
+    if not (tokens := await _auth_store(hass, entry_id).async_load()):
+        return
+    LOGGER.debug("Restoring saved Whirlpool tokens")
+    # The library can only persist tokens to a file, so its auth data is set directly
+    auth._auth_dict = {**auth._auth_dict, **tokens}
+
+
+async def async_save_auth(hass: HomeAssistant, entry_id: str, auth: Auth) -> None:
+    """Save the tokens of an Auth instance."""
+    if auth._auth_dict:
+        await _auth_store(hass, entry_id).async_save(dict(auth._auth_dict))
+
+
+async def async_remove_auth(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the saved tokens of a config entry."""
+    await _auth_store(hass, entry_id).async_remove()
+
+
+def _inventory_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the appliance inventory store of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.inventory")
+
+
+async def async_load_inventory(
+    hass: HomeAssistant, entry_id: str
+) -> list[dict[str, Any]] | None:
+    """Return the saved ovens of a config entry, with their cavities."""
+    if (data := await _inventory_store(hass, entry_id).async_load()) is None:
+        return None
+    return data["ovens"]
+
+
+async def async_save_inventory(
+    hass: HomeAssistant, entry_id: str, ovens: list[dict[str, Any]]
+) -> None:
+    """Save the ovens of a config entry, with their cavities."""
+    await _inventory_store(hass, entry_id).async_save({"ovens": ovens})
+
+
+async def async_remove_inventory(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the saved appliance inventory of a config entry."""
+    await _inventory_store(hass, entry_id).async_remove()
+
+
+def _sessions_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the cook session statistics store of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.sessions")
+
+
+async def async_load_sessions(
+    hass: HomeAssistant, entry_id: str
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """Return the saved cook session statistics of a config entry, by oven and cavity."""
+    if (data := await _sessions_store(hass, entry_id).async_load()) is None:
+        return {}
+    return data["ovens"]
+
+
+async def async_save_sessions(
+    hass: HomeAssistant, entry_id: str, ovens: dict[str, dict[str, dict[str, Any]]]
+) -> None:
+    """Save the cook session statistics of a config entry, by oven and cavity."""
+    await _sessions_store(hass, entry_id).async_save({"ovens": ovens})
+
+
+async def async_remove_sessions(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the saved cook session statistics of a config entry."""
+    await _sessions_store(hass, entry_id).async_remove()
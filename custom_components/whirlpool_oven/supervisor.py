@@ -0,0 +1,120 @@
+"""Connection supervision for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+import random
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    LOGGER,
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return the delay before a retry, with exponential backoff and full jitter."""
+    return random.uniform(
+        RECONNECT_MIN_DELAY,
+        min(RECONNECT_MAX_DELAY, RECONNECT_MIN_DELAY * 2**attempt),
+    )
+
+
+class ConnectionState(StrEnum):
+    """State of a supervised connection."""
+
+    CONNECTING = "connecting"
+    LIVE = "live"
+    STALE = "stale"
+    BACKING_OFF = "backing_off"
+    CLOSED = "closed"
+
+
+class ConnectionSupervisor:
+    """Keep a push connection up, reconnecting with exponential backoff.
+
+    The connect callable bounds its own duration, raising TimeoutError if it hangs.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        connect: Callable[[], Awaitable[None]],
+        disconnect: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize the supervisor."""
+        self.hass = hass
+        self.name = name
+        self.state = ConnectionState.CLOSED
+        self.reconnects = 0
+        self._connect = connect
+        self._disconnect = disconnect
+        self._attempt = 0
+        self._reconnect_task: asyncio.Task | None = None
+
+    async def async_start(self) -> None:
+        """Open the connection, retrying in the background if that fails."""
+        self.state = ConnectionState.CONNECTING
+        try:
+            await self._connect()
+        except (ClientError, TimeoutError) as err:
+            LOGGER.warning(f"Unable to connect {self.name}: {err}")
+            self._async_start_reconnect()
+        else:
+            self.state = ConnectionState.LIVE
+
+    @callback
+    def async_mark_stale(self) -> None:
+        """Reconnect a connection that stopped working."""
+        if self.state != ConnectionState.LIVE:
+            return
+        LOGGER.info(f"Connection {self.name} is stale, reconnecting")
+        self.state = ConnectionState.STALE
+        self._async_start_reconnect()
+
+    async def async_stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        self.state = ConnectionState.CLOSED
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        await self._disconnect()
+
+    @callback
+    def _async_start_reconnect(self) -> None:
+        """Start reconnecting in the background."""
+        if self._reconnect_task is None:
+            self._reconnect_task = self.hass.async_create_background_task(
+                self._async_reconnect(), f"{self.name}-reconnect"
+            )
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect with exponential backoff and full jitter."""
+        while self.state != ConnectionState.CLOSED:
+            self.state = ConnectionState.BACKING_OFF
+            delay = backoff_delay(self._attempt)
+            LOGGER.debug(f"Reconnecting {self.name} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+            self.state = ConnectionState.CONNECTING
+            try:
+                await self._disconnect()
+                await self._connect()
+            except (ClientError, TimeoutError) as err:
+                LOGGER.debug(f"Reconnecting {self.name} failed: {err}")
+                self._attempt += 1
+                continue
+
+            LOGGER.info(f"Reconnected {self.name}")
+            self.state = ConnectionState.LIVE
+            self.reconnects += 1
+            self._attempt = 0
+            break
+        self._reconnect_task = None
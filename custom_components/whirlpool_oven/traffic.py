@@ -0,0 +1,165 @@
+"""Recording and replay of oven push traffic for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import json
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+import queue
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LOGGER, TRAFFIC_LOG_BACKUPS, TRAFFIC_LOG_MAX_BYTES
+
+if TYPE_CHECKING:
+    from .device import WhirlpoolOvenDevice
+
+
+def traffic_log_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the path of the traffic log of a config entry."""
+    return hass.config.path(f"{DOMAIN}.{entry_id}.traffic.jsonl")
+
+
+def traffic_log_files(path: str) -> list[Path]:
+    """Return the existing files of a traffic log, oldest first."""
+    log = Path(path)
+    backups = sorted(
+        (
+            backup
+            for backup in log.parent.glob(f"{log.name}.*")
+            if backup.suffix[1:].isdigit()
+        ),
+        key=lambda backup: int(backup.suffix[1:]),
+        reverse=True,
+    )
+    return [*backups, log] if log.exists() else backups
+
+
+def remove_traffic_log(path: str) -> None:
+    """Delete a traffic log and its backups."""
+    for file in traffic_log_files(path):
+        file.unlink(missing_ok=True)
+
+
+class TrafficRecorder:
+    """Write the raw push messages of ovens to a rotating JSON lines log.
+
+    Every successful data fetch is written too, as a snapshot of all attributes,
+    so a replay can start from the state the push messages change.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = TRAFFIC_LOG_MAX_BYTES,
+        backups: int = TRAFFIC_LOG_BACKUPS,
+    ) -> None:
+        """Open the log, which is written from a thread to keep file I/O off the loop."""
+        self.path = path
+        self.messages = 0
+        self._handler = RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener = QueueListener(records, self._handler)
+        # Records go straight to the queue, without a logger that would outlive the log
+        self._queue_handler = QueueHandler(records)
+        self._listener.start()
+
+    def attach(self, device: WhirlpoolOvenDevice) -> None:
+        """Record the push messages and fetched data of an oven from now on."""
+        oven = device.oven
+        said = device.appliance_data.said
+        handler = oven._event_socket_handler
+        fetch_data = oven.fetch_data
+
+        # The library hands its event socket the handler when it connects
+        def record(msg: str) -> None:
+            self.record(said, msg)
+            handler(msg)
+
+        async def fetch_and_record() -> bool:
+            if fetched := await fetch_data():
+                self.record_data(said, oven._data_dict)
+            return fetched
+
+        oven._event_socket_handler = record
+        oven.fetch_data = fetch_and_record
+
+    def record(self, said: str, msg: str) -> None:
+        """Add a push message of an oven to the log."""
+        self.messages += 1
+        self._write({"ts": time.time(), "said": said, "msg": msg})
+
+    def record_data(self, said: str, data: dict[str, Any]) -> None:
+        """Add the data fetched for an oven to the log."""
+        self._write({"ts": time.time(), "said": said, "data": data})
+
+    def _write(self, record: dict[str, Any]) -> None:
+        """Hand a record to the thread writing the log."""
+        self._queue_handler.handle(
+            logging.makeLogRecord(
+                {
+                    "name": f"{DOMAIN}.traffic",
+                    "levelno": logging.INFO,
+                    "levelname": logging.getLevelName(logging.INFO),
+                    "msg": json.dumps(record, separators=(",", ":")),
+                }
+            )
+        )
+
+    def stop(self) -> None:
+        """Write the remaining messages and close the log."""
+        self._listener.stop()
+        self._handler.close()
+        LOGGER.debug(f"Recorded {self.messages} push messages to {self.path}")
+
+
+def read_traffic(path: str, said: str | None = None) -> Iterator[dict[str, Any]]:
+    """Return the recorded messages and data of a log and its backups, oldest first."""
+    for file in traffic_log_files(path):
+        with file.open(encoding="utf-8") as lines:
+            for line in lines:
+                record = json.loads(line)
+                if said is None or record["said"] == said:
+                    yield record
+
+
+async def async_replay_traffic(
+    device: WhirlpoolOvenDevice,
+    records: list[dict[str, Any]],
+    speed: float | None = 1.0,
+) -> int:
+    """Feed recorded messages to an oven, at a multiple of the recorded pace.
+
+    Recorded data replaces the data of the oven. The library ignores push messages
+    until it has data, so messages before the first recorded data are skipped
+    when the oven has none. Messages are fed as fast as possible when the speed is
+    None. Returns the number of records fed.
+    """
+    oven = device.oven
+    start = time.monotonic()
+    first = records[0]["ts"] if records else 0
+    fed = 0
+    for record in records:
+        if speed is None:
+            # Let the update window and entity updates run between messages
+            await asyncio.sleep(0)
+        elif (delay := (record["ts"] - first) / speed - (time.monotonic() - start)) > 0:
+            await asyncio.sleep(delay)
+        if "data" in record:
+            # Like a data fetch, which replaces the data and calls back
+            oven._data_dict = record["data"]
+            device.on_update()
+        elif oven._data_dict is not None:
+            oven._event_socket_handler(record["msg"])
+        else:
+            continue
+        fed += 1
+    return fed
@@ -0,0 +1,140 @@
+"""Websocket API for the Whirlpool Appliances integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    ATTR_ONLINE,
+    CONF_OVEN,
+    DOMAIN,
+    SIGNAL_DEVICE_CHANGED,
+    WEBSOCKET_BATCH_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from whirlpool.oven import Cavity
+
+    from .device import WhirlpoolOvenDevice
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands of the integration."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("window", default=WEBSOCKET_BATCH_WINDOW): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=10)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send the values of every oven, then the values that change."""
+    subscription = DeltaSubscription(hass, connection, msg["id"], msg["window"])
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+    subscription.async_send_all()
+
+
+class DeltaSubscription:
+    """Send the changed values of the ovens to a websocket connection in batches."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        window: float,
+    ) -> None:
+        """Initialize the subscription."""
+        self.hass = hass
+        self.connection = connection
+        self.msg_id = msg_id
+        self.window = window
+        self._pending: dict[
+            str, tuple[WhirlpoolOvenDevice, set[tuple[Cavity | None, str]]]
+        ] = {}
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._unsub = async_dispatcher_connect(
+            hass, SIGNAL_DEVICE_CHANGED, self._async_handle_change
+        )
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop sending changes."""
+        self._unsub()
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+
+    @callback
+    def async_send_all(self) -> None:
+        """Send all values of every oven."""
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            for device in entry_data.get(CONF_OVEN, {}).values():
+                self._pending[device.appliance_data.said] = (
+                    device,
+                    {
+                        (None, ATTR_ONLINE),
+                        *(
+                            (cavity, attribute)
+                            for cavity in device.cavities or ()
+                            for attribute in device.snapshot(cavity).__slots__
+                        ),
+                    },
+                )
+        self._async_flush()
+
+    @callback
+    def _async_handle_change(
+        self, device: WhirlpoolOvenDevice, changed: set[tuple[Cavity | None, str]]
+    ) -> None:
+        """Collect the changes of an oven until the batch is sent."""
+        said = device.appliance_data.said
+        if said in self._pending:
+            self._pending[said][1].update(changed)
+        else:
+            self._pending[said] = (device, set(changed))
+        if self.window == 0:
+            self._async_flush()
+        elif self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, self.window, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Send the latest values of the fields that changed."""
+        self._cancel_flush = None
+        ovens: dict[str, dict[str, Any]] = {}
+        for said, (device, changed) in self._pending.items():
+            oven: dict[str, Any] = {}
+            for cavity, attribute in changed:
+                if cavity is None:
+                    oven[attribute] = device.is_online
+                else:
+                    oven.setdefault(cavity.name.lower(), {})[attribute] = getattr(
+                        device.snapshot(cavity), attribute
+                    )
+            ovens[said] = oven
+        self._pending.clear()
+        if ovens:
+            self.connection.send_message(
+                websocket_api.event_message(self.msg_id, {"ovens": ovens})
+            )
@@ -0,0 +1 @@
+"""Tests for the Whirlpool Appliances integration."""
@@ -0,0 +1,108 @@
+"""A minimal Home Assistant for tests and benchmarks of the integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+import sys
+import time
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
+from homeassistant.core import CoreState, HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    issue_registry as ir,
+    label_registry as lr,
+    translation,
+)
+
+from .fake_backend import PASSWORD, USERNAME, FakeWhirlpoolBackend
+
+# The integration is imported from the custom_components package of the repository
+REPO_ROOT = Path(__file__).parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DOMAIN = "whirlpool_oven"
+
+ENTRY_DATA = {
+    CONF_USERNAME: USERNAME,
+    CONF_PASSWORD: PASSWORD,
+    CONF_REGION: "EU",
+    "brand": "Whirlpool",
+}
+
+
+@asynccontextmanager
+async def async_test_home_assistant(config_dir: Path) -> AsyncIterator[HomeAssistant]:
+    """Run a Home Assistant with its registries, stopping it afterwards."""
+    # The loader imports the core, and fails when it is imported first
+    from homeassistant import loader
+
+    hass = HomeAssistant(str(config_dir))
+    hass.config.skip_pip = True
+    hass.config.set_time_zone("UTC")
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    entity.async_setup(hass)
+    await ar.async_load(hass)
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await fr.async_load(hass)
+    await ir.async_load(hass)
+    await lr.async_load(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # Dependencies served by the frontend, which a test does not run
+    hass.config.components.update({"websocket_api", "diagnostics"})
+    hass.set_state(CoreState.running)
+    try:
+        yield hass
+    finally:
+        await hass.async_stop(force=True)
+
+
+async def async_add_entry(
+    hass: HomeAssistant, options: dict | None = None
+) -> ConfigEntry:
+    """Add and set up a config entry for the fake account."""
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=USERNAME,
+        data=ENTRY_DATA,
+        source="user",
+        options=options or {},
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def async_wait_connected(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    backend: FakeWhirlpoolBackend,
+    timeout: float = 600,
+) -> float:
+    """Wait until every oven of the entry is subscribed to its push channel."""
+    start = time.monotonic()
+    while backend.subscribers < len(backend.ovens) or not all(
+        device.cavities is not None
+        for device in hass.data[DOMAIN][entry.entry_id]["oven"].values()
+    ):
+        await hass.async_block_till_done()
+        # Let the sockets of the backend and the client make progress
+        await asyncio.sleep(0.01)
+        # The rate limiter spreads the connections of many ovens over minutes
+        if time.monotonic() - start > timeout:
+            raise TimeoutError("The ovens did not connect")
+    return time.monotonic() - start
@@ -0,0 +1,286 @@
+"""A local fake of the Whirlpool cloud, for tests and benchmarks.
+
+The fake serves the endpoints the whirlpool-sixth-sense library calls: the token
+endpoint, the account and appliance lists, the per-appliance data and command
+endpoints, the websocket URL and the STOMP-like push channel. Point the library
+at it with ``backend.patch_urls()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+import json
+import time
+from typing import Any
+
+from aiohttp import WSMsgType, web
+from whirlpool import backendselector
+from whirlpool.types import Region
+
+ACCOUNT_ID = "12345"
+USERNAME = "user@example.com"
+PASSWORD = "password"
+
+MSG_TERMINATION = "\n\n\0"
+
+
+def oven_attributes(cavities: int = 1, light: bool = True) -> dict[str, str]:
+    """Return the attributes of an idle oven with one or two cavities."""
+    attributes = {"Online": "1"}
+    for prefix in ("OvenUpperCavity", "OvenLowerCavity")[:cavities]:
+        attributes |= {
+            f"{prefix}_OpStatusState": "0",
+            f"{prefix}_CycleSetCommonMode": "0",
+            f"{prefix}_DisplStatusDisplayTemp": "0",
+            f"{prefix}_CycleSetTargetTemp": "0",
+            f"{prefix}_OpStatusDoorOpen": "0",
+        }
+        if light:
+            attributes[f"{prefix}_DisplaySetLightOn"] = "0"
+    return attributes
+
+
+class FakeOven:
+    """An oven in the fake account."""
+
+    def __init__(
+        self,
+        said: str,
+        attributes: dict[str, str] | None = None,
+        shared: bool = False,
+    ) -> None:
+        """Initialize the oven."""
+        self.said = said
+        self.shared = shared
+        self.attributes = dict(attributes or oven_attributes())
+        self.updated: dict[str, int] = dict.fromkeys(self.attributes, 0)
+
+    def as_appliance(self) -> dict[str, str]:
+        """Return the oven as listed in the appliance lists."""
+        return {
+            "SAID": self.said,
+            "APPLIANCE_NAME": f"oven {self.said}",
+            "DATA_MODEL_KEY": "cooking_minerva",
+            "CATEGORY_NAME": "Cooking",
+            "MODEL_NO": "WOS51EC0HS",
+            "SERIAL": f"SN{self.said}",
+        }
+
+    def as_data(self) -> dict[str, Any]:
+        """Return the oven as returned by the appliance data endpoint."""
+        return {
+            "attributes": {
+                name: {"value": value, "updateTime": self.updated[name]}
+                for name, value in self.attributes.items()
+            }
+        }
+
+
+class FakeWhirlpoolBackend:
+    """An aiohttp server that answers like the Whirlpool cloud."""
+
+    def __init__(self, ovens: Iterable[FakeOven] = ()) -> None:
+        """Initialize the backend with the ovens of the account."""
+        self.ovens: dict[str, FakeOven] = {oven.said: oven for oven in ovens}
+        self.password = PASSWORD
+        # Request counts per route, and routes answering with an error status
+        self.requests: Counter[str] = Counter()
+        self.failing: dict[str, int] = {}
+        # Seconds added to every HTTP response, to model cloud latency
+        self.latency = 0.0
+        self.url = ""
+        self._sockets: dict[str, set[web.WebSocketResponse]] = {}
+        self._runner: web.AppRunner | None = None
+
+    @classmethod
+    def with_ovens(cls, count: int, cavities: int = 1) -> FakeWhirlpoolBackend:
+        """Return a backend with a number of ovens."""
+        return cls(
+            FakeOven(f"SAID{index:04d}", oven_attributes(cavities))
+            for index in range(count)
+        )
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        app = web.Application()
+        app.router.add_post("/oauth/token", self._token)
+        app.router.add_get("/api/v1/getUserDetails", self._user_details)
+        app.router.add_get(
+            "/api/v2/appliance/all/account/{account_id}", self._owned_appliances
+        )
+        app.router.add_get("/api/v1/share-accounts/appliances", self._shared_appliances)
+        app.router.add_post("/api/v1/appliance/command", self._command)
+        app.router.add_get("/api/v1/appliance/{said}", self._appliance_data)
+        app.router.add_get("/api/v1/client_auth/webSocketUrl", self._websocket_url)
+        app.router.add_get("/websocket", self._websocket)
+        self._runner = web.AppRunner(app, handle_signals=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        """Close the push channels and stop serving."""
+        for sockets in self._sockets.values():
+            for socket in list(sockets):
+                await socket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @contextmanager
+    def patch_urls(self) -> Iterator[None]:
+        """Send the requests of the library for every region to the backend."""
+        saved = dict(backendselector.URLS)
+        backendselector.URLS.update(dict.fromkeys(Region, self.url))
+        try:
+            yield
+        finally:
+            backendselector.URLS.update(saved)
+
+    @property
+    def subscribers(self) -> int:
+        """Return the number of open push channels."""
+        return sum(len(sockets) for sockets in self._sockets.values())
+
+    async def push(self, said: str, attributes: dict[str, str]) -> int:
+        """Change attributes of an oven and send them on its push channels."""
+        oven = self.ovens[said]
+        timestamp = int(time.time() * 1000)
+        for name, value in attributes.items():
+            oven.attributes[name] = value
+            oven.updated[name] = timestamp
+        body = json.dumps(
+            {"said": said, "timestamp": timestamp, "attributeMap": attributes}
+        )
+        frame = f"MESSAGE\ndestination:/topic/{said}\n\n{body}\0"
+        sockets = list(self._sockets.get(said, ()))
+        for socket in sockets:
+            await socket.send_str(frame)
+        return len(sockets)
+
+    async def play(self, script: Iterable[tuple[float, str, dict[str, str]]]) -> None:
+        """Push a script of (delay in seconds, SAID, attributes) steps."""
+        for delay, said, attributes in script:
+            if delay:
+                await asyncio.sleep(delay)
+            await self.push(said, attributes)
+
+    async def _respond(self, route: str, data: Any) -> web.Response:
+        """Count a request and answer it, or fail it if the route is failing."""
+        self.requests[route] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if status := self.failing.get(route):
+            return web.Response(status=status)
+        return web.json_response(data)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        """Answer a password or refresh token grant."""
+        form = await request.post()
+        if form.get("grant_type") == "password" and form.get("password") != (
+            self.password
+        ):
+            self.requests["token"] += 1
+            return web.Response(status=401)
+        return await self._respond(
+            "token",
+            {
+                "access_token": "access",
+                "refresh_token": "refresh",
+                "expires_in": 3600,
+                "accountId": ACCOUNT_ID,
+                "SAID": list(self.ovens),
+            },
+        )
+
+    async def _user_details(self, request: web.Request) -> web.Response:
+        """Answer the account details."""
+        return await self._respond("user_details", {"accountId": ACCOUNT_ID})
+
+    async def _owned_appliances(self, request: web.Request) -> web.Response:
+        """Answer the appliances owned by the account."""
+        return await self._respond(
+            "owned_appliances",
+            {
+                request.match_info["account_id"]: {
+                    "kitchen": [
+                        oven.as_appliance()
+                        for oven in self.ovens.values()
+                        if not oven.shared
+                    ]
+                }
+            },
+        )
+
+    async def _shared_appliances(self, request: web.Request) -> web.Response:
+        """Answer the appliances shared with the account."""
+        return await self._respond(
+            "shared_appliances",
+            {
+                "sharedAppliances": [
+                    {
+                        "appliances": [
+                            oven.as_appliance()
+                            for oven in self.ovens.values()
+                            if oven.shared
+                        ]
+                    }
+                ]
+            },
+        )
+
+    async def _appliance_data(self, request: web.Request) -> web.Response:
+        """Answer the attributes of an oven."""
+        if (oven := self.ovens.get(request.match_info["said"])) is None:
+            self.requests["appliance_data"] += 1
+            return web.Response(status=404)
+        return await self._respond("appliance_data", oven.as_data())
+
+    async def _command(self, request: web.Request) -> web.Response:
+        """Apply a command, then push the changed attributes like an oven does."""
+        data = await request.json()
+        said = data["header"]["said"]
+        response = await self._respond("command", {})
+        if response.status == 200 and said in self.ovens:
+            asyncio.get_running_loop().create_task(self.push(said, data["body"]))
+        return response
+
+    async def _websocket_url(self, request: web.Request) -> web.Response:
+        """Answer the URL of the push channel."""
+        return await self._respond(
+            "websocket_url", {"url": f"{self.url.replace('http', 'ws')}/websocket"}
+        )
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Serve a push channel: acknowledge CONNECT and SUBSCRIBE, then push."""
+        self.requests["websocket"] += 1
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        said: str | None = None
+        try:
+            async for msg in socket:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                command, *headers = msg.data.removesuffix(MSG_TERMINATION).split("\n")
+                if command == "CONNECT":
+                    await socket.send_str(f"CONNECTED\nversion:1.2{MSG_TERMINATION}")
+                elif command == "SUBSCRIBE":
+                    destination = next(
+                        header
+                        for header in headers
+                        if header.startswith("destination:")
+                    )
+                    said = destination.rsplit("/", 1)[-1]
+                    self._sockets.setdefault(said, set()).add(socket)
+                    await socket.send_str(
+                        f"RECEIPT\nreceipt-id:{said}{MSG_TERMINATION}"
+                    )
+        finally:
+            if said is not None:
+                self._sockets[said].discard(socket)
+        return socket
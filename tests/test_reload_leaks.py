@@ -0,0 +1,145 @@
+"""Check that setting up and unloading a config entry does not leak."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+from pathlib import Path
+import tracemalloc
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .common import DOMAIN, async_add_entry, async_test_home_assistant
+from .fake_backend import FakeWhirlpoolBackend
+
+from custom_components.whirlpool_oven.const import DATA_RATE_LIMITER
+from custom_components.whirlpool_oven.device import WhirlpoolOvenDevice
+from custom_components.whirlpool_oven.entity import WhirlpoolEntity
+from custom_components.whirlpool_oven.ratelimit import CloudRateLimiter
+
+OVENS = 1
+WARMUP_CYCLES = 20
+TRACED_WARMUP_CYCLES = 10
+CYCLES = 200
+# Frames kept per allocation, enough to reach the integration from an allocation
+# in Home Assistant or aiohttp
+TRACE_FRAMES = 10
+
+# Growth allowed over the measured cycles, after the warmup filled the caches
+MEMORY_BUDGET_PER_CYCLE = 1_024
+HANDLE_BUDGET = 2
+TASK_BUDGET = 0
+
+# Only memory allocated with the integration, the library or the fake backend on the
+# stack is counted. Home Assistant 2024.3 keeps every unloaded EntityPlatform in
+# hass.data["entity_platform"], which is not a leak of the integration.
+TRACE_FILTERS = [
+    tracemalloc.Filter(True, "*/custom_components/whirlpool_oven/*", all_frames=True),
+    tracemalloc.Filter(True, "*/whirlpool/*", all_frames=True),
+    tracemalloc.Filter(True, "*/tests/fake_backend.py", all_frames=True),
+]
+
+
+def open_handles() -> int:
+    """Return the number of open file descriptors of the process."""
+    return len(os.listdir("/proc/self/fd"))
+
+
+def traced_memory() -> int:
+    """Return the memory allocated by the integration and still in use."""
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot().filter_traces(TRACE_FILTERS)
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+def live_objects(cls: type) -> int:
+    """Return the number of live instances of a class."""
+    gc.collect()
+    return sum(isinstance(obj, cls) for obj in gc.get_objects())
+
+
+async def async_cycle(
+    hass: HomeAssistant, entry: ConfigEntry, backend: FakeWhirlpoolBackend
+) -> None:
+    """Set up the entry, wait for its ovens to connect, then unload it."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    devices = hass.data[DOMAIN][entry.entry_id]["oven"]
+    while backend.subscribers < OVENS or not all(
+        device.connected for device in devices.values()
+    ):
+        await asyncio.sleep(0.005)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    # Let the client and server sides of the closed push channels finish
+    while backend.subscribers:
+        await asyncio.sleep(0.005)
+
+
+async def async_measure_cycles(config_dir: Path) -> dict[str, float]:
+    """Run setup and unload cycles and return the growth over the measured ones."""
+    backend = FakeWhirlpoolBackend.with_ovens(OVENS)
+    await backend.start()
+    try:
+        with backend.patch_urls():
+            async with async_test_home_assistant(config_dir) as hass:
+                # The cycles would otherwise wait minutes for cloud call tokens
+                hass.data[DATA_RATE_LIMITER] = CloudRateLimiter(
+                    hass, rate=10_000, burst=10_000
+                )
+                entry = await async_add_entry(hass)
+                assert await hass.config_entries.async_unload(entry.entry_id)
+                await hass.async_block_till_done()
+
+                for _ in range(WARMUP_CYCLES):
+                    await async_cycle(hass, entry, backend)
+
+                # Tracing slows the cycles down, so it only starts after the warmup;
+                # the first traced cycles replace objects allocated before it
+                tracemalloc.start(TRACE_FRAMES)
+                for _ in range(TRACED_WARMUP_CYCLES):
+                    await async_cycle(hass, entry, backend)
+
+                memory = traced_memory()
+                handles = open_handles()
+                tasks = len(asyncio.all_tasks())
+
+                for _ in range(CYCLES):
+                    await async_cycle(hass, entry, backend)
+
+                return {
+                    "memory_per_cycle": (traced_memory() - memory) / CYCLES,
+                    "handles": open_handles() - handles,
+                    "tasks": len(asyncio.all_tasks()) - tasks,
+                    "devices": live_objects(WhirlpoolOvenDevice),
+                    "entities": live_objects(WhirlpoolEntity),
+                }
+    finally:
+        await backend.stop()
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="Counting handles needs /proc"
+)
+def test_reload_cycles_do_not_leak(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Repeated setup and unload cycles keep memory, handles and tasks flat."""
+    # Captured log records would keep what they log alive
+    caplog.set_level(logging.CRITICAL)
+    try:
+        growth = asyncio.run(async_measure_cycles(tmp_path))
+    finally:
+        tracemalloc.stop()
+
+    assert growth["memory_per_cycle"] <= MEMORY_BUDGET_PER_CYCLE, growth
+    assert growth["handles"] <= HANDLE_BUDGET, growth
+    assert growth["tasks"] <= TASK_BUDGET, growth
+    # Nothing may keep the ovens or entities of unloaded entries alive
+    assert growth["devices"] == 0, growth
+    assert growth["entities"] == 0, growth